@@ -1,6 +1,6 @@
 """Hand management - closed tiles, melds, discard pool."""
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from .tile import Tile, tiles_to_34_array
 from .meld import Meld
@@ -37,6 +37,10 @@ class Hand:
         self.closed_tiles.append(tile)
         self.draw_tile = tile
 
+    def add_closed_tiles(self, tiles: Iterable[Tile]):
+        """Add tiles to the closed hand without marking a draw."""
+        self.closed_tiles.extend(tiles)
+
     def discard(self, tile: Tile, is_tsumogiri: bool = False):
         """Discard a tile from hand."""
         self.closed_tiles.remove(tile)
@@ -1,7 +1,8 @@
 """Tile definition with dual encoding (136/34) and red dora support."""
 
 from enum import IntEnum
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
 class TileSuit(IntEnum):
@@ -32,7 +33,8 @@ TILE_NAMES_34 = [
 
 class Tile:
     """Immutable tile with 136 encoding (unique identity) and 34 encoding (algorithm use)."""
-    __slots__ = ('_id', '_index34', '_suit', '_number', '_is_red')
+    __slots__ = ('_id', '_index34', '_suit', '_number', '_is_red',
+                 '_is_honor', '_is_terminal', '_is_yaochu')
 
     def __init__(self, tile_id: int):
         if not (0 <= tile_id < 136):
@@ -56,6 +58,11 @@ class Tile:
             self._suit = TileSuit.DRAGON
             self._number = self._index34 - 31 + 1  # 1=白,2=發,3=中
         self._is_red = tile_id in RED_DORA_IDS
+        # Derived classification flags, fixed per tile: computed once here
+        # rather than re-derived through chained properties on every access
+        self._is_honor = self._index34 >= 27
+        self._is_terminal = not self._is_honor and self._number in (1, 9)
+        self._is_yaochu = self._is_honor or self._is_terminal
 
     @property
     def id(self) -> int:
@@ -79,19 +86,19 @@ class Tile:
 
     @property
     def is_honor(self) -> bool:
-        return self._suit in (TileSuit.WIND, TileSuit.DRAGON)
+        return self._is_honor
 
     @property
     def is_terminal(self) -> bool:
-        return not self.is_honor and self._number in (1, 9)
+        return self._is_terminal
 
     @property
     def is_yaochu(self) -> bool:
-        return self.is_honor or self.is_terminal
+        return self._is_yaochu
 
     @property
     def is_number_tile(self) -> bool:
-        return self._suit in (TileSuit.MAN, TileSuit.PIN, TileSuit.SOU)
+        return not self._is_honor
 
     @property
     def name(self) -> str:
@@ -133,7 +140,8 @@ def tiles_to_34_array(tiles: List[Tile]) -> List[int]:
     """Convert list of tiles to 34-length count array."""
     arr = [0] * 34
     for t in tiles:
-        arr[t.index34] += 1
+        # Read the slot directly: skips the index34 property call per tile
+        arr[t._index34] += 1
     return arr
 
 
@@ -149,7 +157,7 @@ def tile_34_array_from_ids(tile_ids: List[int]) -> List[int]:
 ALL_TILES_136 = [Tile(i) for i in range(136)]
 
 
-def next_tile_index(index34: int, is_sanma: bool = False) -> int:
+def _compute_next_tile_index(index34: int, is_sanma: bool) -> int:
     """Get the 'next' tile index for dora indicator calculation.
 
     For number tiles: wraps 9->1 (sanma man: 1m indicator -> 9m dora, skipping 2-8)
@@ -182,53 +190,73 @@ def next_tile_index(index34: int, is_sanma: bool = False) -> int:
         return 31 + (index34 - 31 + 1) % 3
 
 
+# Indicator index34 -> dora index34, one table per player count
+DORA_NEXT_4P: Tuple[int, ...] = tuple(_compute_next_tile_index(i, False) for i in range(34))
+DORA_NEXT_3P: Tuple[int, ...] = tuple(_compute_next_tile_index(i, True) for i in range(34))
+
+
+def next_tile_index(index34: int, is_sanma: bool = False) -> int:
+    """Get the 'next' tile index for dora indicator calculation."""
+    return DORA_NEXT_3P[index34] if is_sanma else DORA_NEXT_4P[index34]
+
+
+# Shorthand parse table: char -> (kind, value). Digits carry their number,
+# suit letters the 136-id of the suit's first tile and of its red five,
+# honors their fixed 136-id.
+_DIGIT, _SUIT, _HONOR = 0, 1, 2
+_PARSE_TABLE = {str(n): (_DIGIT, n) for n in range(10)}
+_PARSE_TABLE.update({
+    'm': (_SUIT, (0, RED_FIVE_MAN)),
+    'p': (_SUIT, (9 * 4, RED_FIVE_PIN)),
+    's': (_SUIT, (18 * 4, RED_FIVE_SOU)),
+})
+_PARSE_TABLE.update({ch: (_HONOR, (27 + i) * 4) for i, ch in enumerate('東南西北白發中')})
+
+
+@lru_cache(maxsize=None)
+def _tile_ids_from_string(s: str) -> Tuple[int, ...]:
+    """Parse a shorthand tile string into 136 tile ids (memoized)."""
+    ids = []
+    numbers = []
+    table_get = _PARSE_TABLE.get
+    for ch in s:
+        entry = table_get(ch)
+        if entry is None:
+            continue
+        kind, value = entry
+        if kind is _DIGIT:
+            numbers.append(value)
+        elif kind is _SUIT:
+            base, red_id = value
+            # 0 denotes the red five
+            ids.extend(red_id if n == 0 else base + (n - 1) * 4 for n in numbers)
+            numbers = []
+        else:
+            ids.append(value)
+    return tuple(ids)
+
+
 def make_tiles_from_string(s: str) -> List[Tile]:
     """Parse a shorthand string like '123m456p789s東南西北' into tiles.
 
     Uses the first available tile_id for each tile (no red dora by default).
-    For red dora, use '0m', '0p', '0s'.
+    For red dora, use '0m', '0p', '0s'. Returns a fresh list per call; the
+    string parse itself is cached.
     """
-    tiles = []
-    numbers = []
-    i = 0
-    while i < len(s):
-        ch = s[i]
-        if ch.isdigit():
-            numbers.append(int(ch))
-            i += 1
-        elif ch in ('m', 'p', 's'):
-            suit_offset = {'m': 0, 'p': 9, 's': 18}[ch]
-            for n in numbers:
-                if n == 0:
-                    # Red dora
-                    red_ids = {'m': RED_FIVE_MAN, 'p': RED_FIVE_PIN, 's': RED_FIVE_SOU}
-                    tiles.append(ALL_TILES_136[red_ids[ch]])
-                else:
-                    index34 = suit_offset + n - 1
-                    tiles.append(ALL_TILES_136[index34 * 4])
-            numbers = []
-            i += 1
-        elif ch == '東':
-            tiles.append(ALL_TILES_136[27 * 4])
-            i += 1
-        elif ch == '南':
-            tiles.append(ALL_TILES_136[28 * 4])
-            i += 1
-        elif ch == '西':
-            tiles.append(ALL_TILES_136[29 * 4])
-            i += 1
-        elif ch == '北':
-            tiles.append(ALL_TILES_136[30 * 4])
-            i += 1
-        elif ch == '白':
-            tiles.append(ALL_TILES_136[31 * 4])
-            i += 1
-        elif ch == '發':
-            tiles.append(ALL_TILES_136[32 * 4])
-            i += 1
-        elif ch == '中':
-            tiles.append(ALL_TILES_136[33 * 4])
-            i += 1
-        else:
-            i += 1
-    return tiles
+    return [ALL_TILES_136[i] for i in _tile_ids_from_string(s)]
+
+
+@lru_cache(maxsize=None)
+def _counts_from_string(s: str) -> Tuple[int, ...]:
+    arr = [0] * 34
+    for tile_id in _tile_ids_from_string(s):
+        arr[tile_id >> 2] += 1
+    return tuple(arr)
+
+
+def counts_from_string(s: str) -> List[int]:
+    """Parse a shorthand string like '123m456p789s東南' into a 34-count array.
+
+    Same notation as make_tiles_from_string. Returns a fresh list per call.
+    """
+    return list(_counts_from_string(s))
@@ -3,7 +3,10 @@
 import random
 from typing import List, Optional
 
-from .tile import Tile, ALL_TILES_136, next_tile_index
+from .tile import Tile, ALL_TILES_136, DORA_NEXT_3P, DORA_NEXT_4P
+
+# Sanma removes 2m-8m (indices 1-7 in 34 encoding, tile_ids 4-31)
+_SANMA_TILES = tuple(t for t in ALL_TILES_136 if not (4 <= t.id < 32))
 
 
 class Wall:
@@ -23,24 +26,22 @@ class Wall:
 
     def _build_wall(self, shuffle: bool):
         """Build and shuffle the wall."""
-        if self.is_sanma:
-            # Remove 2m-8m (indices 1-7 in 34 encoding, tile_ids 4-31)
-            self.all_tiles = [Tile(i) for i in range(136)
-                              if not (4 <= i < 32)]
-        else:
-            self.all_tiles = [Tile(i) for i in range(136)]
+        self.all_tiles = list(_SANMA_TILES if self.is_sanma else ALL_TILES_136)
 
         if shuffle:
             random.shuffle(self.all_tiles)
 
         # Dead wall: last 14 tiles
         self.dead_wall = self.all_tiles[-14:]
-        self.live_wall = list(self.all_tiles[:-14])
+        # Live wall: the tiles before it, drawn front to back by index
+        self._draw_pos = 0
+        self._live_end = len(self.all_tiles) - 14
 
         # Dora state
         self._dora_revealed = 1  # Start with 1 dora indicator revealed
         self._dora_revealed_limit = None
         self._rinshan_drawn = 0  # How many rinshan tiles have been drawn
+        self._reset_dora_cache()
 
     @classmethod
     def from_tiles(cls, live_wall_tiles, dead_wall_tiles, is_sanma=False,
@@ -49,26 +50,51 @@ class Wall:
         wall = cls.__new__(cls)
         wall.is_sanma = is_sanma
         wall.all_tiles = list(live_wall_tiles) + list(dead_wall_tiles)
-        wall.live_wall = list(live_wall_tiles)
         wall.dead_wall = list(dead_wall_tiles)
+        wall._draw_pos = 0
+        wall._live_end = len(live_wall_tiles)
         wall._dora_revealed = max(1, min(dora_revealed, 5))
         wall._dora_revealed_limit = wall._dora_revealed
         wall._rinshan_drawn = 0
+        wall._reset_dora_cache()
         return wall
 
+    def _reset_dora_cache(self):
+        """Reset memoized dora/ura-dora 34 indices.
+
+        _dora_version is bumped whenever a new indicator is revealed; the
+        cached lists are rebuilt lazily when their version falls behind.
+        """
+        self._dora_version = 0
+        self._dora_cache: List[int] = []
+        self._dora_cache_version = -1
+        self._uradora_cache: List[int] = []
+        self._uradora_cache_version = -1
+
+    @property
+    def live_wall(self) -> List[Tile]:
+        """Tiles still drawable from the live wall, in draw order.
+
+        Returns a new slice on each access; modifying it does not change
+        the wall.
+        """
+        return self.all_tiles[self._draw_pos:self._live_end]
+
     @property
     def remaining(self) -> int:
         """Number of drawable tiles remaining in live wall."""
-        return len(self.live_wall)
+        return self._live_end - self._draw_pos
 
     @property
     def is_empty(self) -> bool:
-        return len(self.live_wall) == 0
+        return self._draw_pos >= self._live_end
 
     def draw(self) -> Optional[Tile]:
         """Draw a tile from the live wall."""
-        if self.live_wall:
-            return self.live_wall.pop(0)
+        pos = self._draw_pos
+        if pos < self._live_end:
+            self._draw_pos = pos + 1
+            return self.all_tiles[pos]
         return None
 
     def draw_rinshan(self) -> Optional[Tile]:
@@ -82,13 +108,14 @@ class Wall:
     def reveal_new_dora(self):
         """Reveal a new dora indicator (after kan)."""
         # Kan reduces live wall by 1 to keep dead wall at 14 tiles.
-        if self.live_wall:
-            self.live_wall.pop()
+        if self._draw_pos < self._live_end:
+            self._live_end -= 1
         if self._dora_revealed_limit is not None:
             if self._dora_revealed >= self._dora_revealed_limit:
                 return
         if self._dora_revealed < 5:
             self._dora_revealed += 1
+            self._dora_version += 1
 
     @property
     def dora_indicators(self) -> List[Tile]:
@@ -108,17 +135,21 @@ class Wall:
 
     def get_dora_tiles_34(self) -> List[int]:
         """Get 34 indices of actual dora tiles from indicators."""
-        dora_indices = []
-        for indicator in self.dora_indicators:
-            dora_indices.append(next_tile_index(indicator.index34, self.is_sanma))
-        return dora_indices
+        if self._dora_cache_version != self._dora_version:
+            dora_next = DORA_NEXT_3P if self.is_sanma else DORA_NEXT_4P
+            self._dora_cache = [dora_next[self.dead_wall[i * 2].index34]
+                                for i in range(self._dora_revealed)]
+            self._dora_cache_version = self._dora_version
+        return list(self._dora_cache)
 
     def get_uradora_tiles_34(self) -> List[int]:
         """Get 34 indices of actual ura-dora tiles."""
-        dora_indices = []
-        for indicator in self.uradora_indicators:
-            dora_indices.append(next_tile_index(indicator.index34, self.is_sanma))
-        return dora_indices
+        if self._uradora_cache_version != self._dora_version:
+            dora_next = DORA_NEXT_3P if self.is_sanma else DORA_NEXT_4P
+            self._uradora_cache = [dora_next[self.dead_wall[i * 2 + 1].index34]
+                                   for i in range(self._dora_revealed)]
+            self._uradora_cache_version = self._dora_version
+        return list(self._uradora_cache)
 
     @property
     def total_tiles(self) -> int:
@@ -257,6 +257,53 @@ class RoundState:
                         discard_tile, from_player)
             actions.can_chi.append(meld)
 
+    def can_chi(self, player_idx: int, discard_tile: Tile, discard_player: int,
+                tiles_34: List[int]) -> bool:
+        """Check whether a specific chi (given as 34 indices) is available.
+
+        Equivalent to matching against get_response_actions().can_chi, but
+        checks the one sequence directly instead of enumerating them all.
+        """
+        hand = self.players[player_idx].hand
+        if hand.is_riichi or self.is_sanma or discard_tile.is_honor:
+            return False
+        if discard_player != (player_idx - 1) % self.num_players:
+            return False
+        if len(tiles_34) != 3:
+            return False
+        a, b, c = sorted(tiles_34)
+        if b != a + 1 or c != b + 1 or a // 9 != c // 9:
+            return False
+        rest = [a, b, c]
+        if discard_tile.index34 not in rest:
+            return False
+        rest.remove(discard_tile.index34)
+        x, y = rest
+        return (any(t.index34 == x for t in hand.closed_tiles) and
+                any(t.index34 == y for t in hand.closed_tiles))
+
+    def can_pon(self, player_idx: int, discard_tile: Tile, discard_player: int,
+                tiles_34: List[int]) -> bool:
+        """Check whether a specific pon (given as 34 indices) is available."""
+        return self._can_call_set(player_idx, discard_tile, tiles_34, 3)
+
+    def can_daiminkan(self, player_idx: int, discard_tile: Tile,
+                      discard_player: int, tiles_34: List[int]) -> bool:
+        """Check whether a specific daiminkan (given as 34 indices) is available."""
+        return self._can_call_set(player_idx, discard_tile, tiles_34, 4)
+
+    def _can_call_set(self, player_idx: int, discard_tile: Tile,
+                      tiles_34: List[int], size: int) -> bool:
+        """Check a pon/daiminkan of `size` identical tiles on the discard."""
+        hand = self.players[player_idx].hand
+        if hand.is_riichi or len(tiles_34) != size:
+            return False
+        tile_34 = discard_tile.index34
+        if any(i != tile_34 for i in tiles_34):
+            return False
+        held = sum(1 for t in hand.closed_tiles if t.index34 == tile_34)
+        return held >= size - 1
+
     def _get_riichi_candidates(self, player_idx: int) -> List[Tile]:
         """Get tiles that can be discarded for riichi (must result in tenpai)."""
         hand = self.players[player_idx].hand
@@ -281,32 +328,34 @@ class RoundState:
         player = self.players[player_idx]
         hand = player.hand
 
-        if is_tsumo:
-            test_hand = hand
-        else:
-            test_hand = hand.clone()
-            test_hand.closed_tiles.append(win_tile)
-
-        result = calculate_score(
-            hand=test_hand,
-            win_tile=win_tile,
-            is_tsumo=is_tsumo,
-            seat_wind_34=player.seat_wind.index34,
-            round_wind_34=self.round_wind.index34,
-            is_dealer=player.is_dealer,
-            dora_tiles_34=self.wall.get_dora_tiles_34(),
-            uradora_tiles_34=self.wall.get_uradora_tiles_34(),
-            honba=self.honba,
-            is_riichi=hand.is_riichi,
-            is_double_riichi=hand.is_double_riichi,
-            is_ippatsu=hand.is_ippatsu,
-            is_haitei=self.is_haitei if is_tsumo else False,
-            is_houtei=self.is_haitei if not is_tsumo else False,
-            is_rinshan=self.is_rinshan,
-            is_tenhou=(player.is_dealer and self.turn_count == 0),
-            is_chiihou=(not player.is_dealer and self.first_draw[player_idx]),
-            is_sanma=self.is_sanma,
-        )
+        # For ron, temporarily add the win tile; calculate_score only reads
+        # the hand, so append/pop avoids cloning it.
+        if not is_tsumo:
+            hand.closed_tiles.append(win_tile)
+        try:
+            result = calculate_score(
+                hand=hand,
+                win_tile=win_tile,
+                is_tsumo=is_tsumo,
+                seat_wind_34=player.seat_wind.index34,
+                round_wind_34=self.round_wind.index34,
+                is_dealer=player.is_dealer,
+                dora_tiles_34=self.wall.get_dora_tiles_34(),
+                uradora_tiles_34=self.wall.get_uradora_tiles_34(),
+                honba=self.honba,
+                is_riichi=hand.is_riichi,
+                is_double_riichi=hand.is_double_riichi,
+                is_ippatsu=hand.is_ippatsu,
+                is_haitei=self.is_haitei if is_tsumo else False,
+                is_houtei=self.is_haitei if not is_tsumo else False,
+                is_rinshan=self.is_rinshan,
+                is_tenhou=(player.is_dealer and self.turn_count == 0),
+                is_chiihou=(not player.is_dealer and self.first_draw[player_idx]),
+                is_sanma=self.is_sanma,
+            )
+        finally:
+            if not is_tsumo:
+                hand.closed_tiles.pop()
         return result is not None
 
     def process_draw(self, player_idx: int) -> Optional[Tile]:
@@ -545,24 +594,21 @@ class RoundState:
             round_result.winners = [player_idx]
             round_result.score_results = [(player_idx, result)]
 
-            if player.is_dealer:
-                for i in range(self.num_players):
-                    if i != player_idx:
-                        round_result.score_changes[i] = -result.non_dealer_payment
-                        round_result.score_changes[player_idx] += result.non_dealer_payment
-            else:
-                for i in range(self.num_players):
-                    if i == player_idx:
-                        continue
-                    if self.players[i].is_dealer:
-                        round_result.score_changes[i] = -result.dealer_payment
-                        round_result.score_changes[player_idx] += result.dealer_payment
-                    else:
-                        round_result.score_changes[i] = -result.non_dealer_payment
-                        round_result.score_changes[player_idx] += result.non_dealer_payment
+            # Each other seat pays its share; the winner collects the total.
+            # A dealer winner has no dealer among the payers.
+            changes = round_result.score_changes
+            non_dealer_pay = result.non_dealer_payment
+            dealer_pay = result.dealer_payment
+            total = 0
+            for i, other in enumerate(self.players):
+                if i == player_idx:
+                    continue
+                pay = dealer_pay if other.is_dealer else non_dealer_pay
+                changes[i] = -pay
+                total += pay
 
             # Riichi sticks go to winner
-            round_result.score_changes[player_idx] += self.riichi_sticks * 1000
+            changes[player_idx] += total + self.riichi_sticks * 1000
             round_result.riichi_sticks_winner = player_idx
 
             round_result.dealer_continues = player.is_dealer
@@ -577,28 +623,29 @@ class RoundState:
         player = self.players[winner_idx]
         hand = player.hand
 
-        # Temporarily add the win tile for scoring
-        test_hand = hand.clone()
-        test_hand.closed_tiles.append(win_tile)
-
         is_last_tile = self.wall.remaining == 0
 
-        result = calculate_score(
-            hand=test_hand,
-            win_tile=win_tile,
-            is_tsumo=False,
-            seat_wind_34=player.seat_wind.index34,
-            round_wind_34=self.round_wind.index34,
-            is_dealer=player.is_dealer,
-            dora_tiles_34=self.wall.get_dora_tiles_34(),
-            uradora_tiles_34=self.wall.get_uradora_tiles_34(),
-            honba=self.honba,
-            is_riichi=hand.is_riichi,
-            is_double_riichi=hand.is_double_riichi,
-            is_ippatsu=hand.is_ippatsu,
-            is_houtei=is_last_tile,
-            is_sanma=self.is_sanma,
-        )
+        # Temporarily add the win tile for scoring (append/pop, no clone)
+        hand.closed_tiles.append(win_tile)
+        try:
+            result = calculate_score(
+                hand=hand,
+                win_tile=win_tile,
+                is_tsumo=False,
+                seat_wind_34=player.seat_wind.index34,
+                round_wind_34=self.round_wind.index34,
+                is_dealer=player.is_dealer,
+                dora_tiles_34=self.wall.get_dora_tiles_34(),
+                uradora_tiles_34=self.wall.get_uradora_tiles_34(),
+                honba=self.honba,
+                is_riichi=hand.is_riichi,
+                is_double_riichi=hand.is_double_riichi,
+                is_ippatsu=hand.is_ippatsu,
+                is_houtei=is_last_tile,
+                is_sanma=self.is_sanma,
+            )
+        finally:
+            hand.closed_tiles.pop()
 
         return result
 
@@ -1,9 +1,10 @@
 """Score calculation - convert han + fu to points."""
 
+from functools import lru_cache
 from typing import List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
-from mahjong.core.tile import Tile, tiles_to_34_array
+from mahjong.core.tile import Tile
 from mahjong.core.meld import Meld
 from mahjong.core.hand import Hand
 from mahjong.rules.agari import decompose_standard, is_chiitoi_agari, is_kokushi_agari, Decomposition
@@ -69,21 +70,67 @@ def calculate_score(
     is_sanma: bool = False,
     kita_count: int = 0,
 ) -> Optional[ScoreResult]:
-    """Calculate score for a winning hand. Returns None if no valid yaku."""
+    """Calculate score for a winning hand. Returns None if no valid yaku.
+
+    The result depends only on the tile counts, red fives, melds and the
+    situational flags, so evaluation is cached on that signature. Each call
+    returns its own copy of the cached ScoreResult.
+    """
+    cached = _calculate_score_cached(
+        tuple(hand.to_34_array()),
+        sum(1 for t in hand.closed_tiles if t.is_red),
+        tuple(hand.melds),
+        win_tile.index34, is_tsumo, seat_wind_34, round_wind_34, is_dealer,
+        tuple(dora_tiles_34), tuple(uradora_tiles_34), honba,
+        is_riichi, is_double_riichi, is_ippatsu, is_haitei, is_houtei,
+        is_rinshan, is_chankan, is_tenhou, is_chiihou, is_sanma, kita_count,
+    )
+    if cached is None:
+        return None
+    return replace(cached, yaku=list(cached.yaku))
+
+
+@lru_cache(maxsize=1 << 14)
+def _calculate_score_cached(
+    closed_key: Tuple[int, ...],
+    closed_red_count: int,
+    melds: Tuple[Meld, ...],
+    win_tile_34: int,
+    is_tsumo: bool,
+    seat_wind_34: int,
+    round_wind_34: int,
+    is_dealer: bool,
+    dora_tiles_34: Tuple[int, ...],
+    uradora_tiles_34: Tuple[int, ...],
+    honba: int,
+    is_riichi: bool,
+    is_double_riichi: bool,
+    is_ippatsu: bool,
+    is_haitei: bool,
+    is_houtei: bool,
+    is_rinshan: bool,
+    is_chankan: bool,
+    is_tenhou: bool,
+    is_chiihou: bool,
+    is_sanma: bool,
+    kita_count: int,
+) -> Optional[ScoreResult]:
     best_result = None
 
     # Count dora in all tiles
-    all_tiles = list(hand.closed_tiles)
-    for meld in hand.melds:
-        all_tiles.extend(meld.tiles)
-    all_tiles_34 = tiles_to_34_array(all_tiles)
+    counts = list(closed_key)
+    red_dora_count = closed_red_count
+    for meld in melds:
+        for t in meld.tiles:
+            counts[t.index34] += 1
+            red_dora_count += t.is_red
+    all_tiles_34 = tuple(counts)
 
     dora_count = sum(all_tiles_34[d] for d in dora_tiles_34) + kita_count
     # In sanma, kita tiles are removed from hand but still count as dora
     # when north is a dora indicator result.
     if is_sanma and kita_count > 0 and 30 in dora_tiles_34:
         dora_count += kita_count
-    red_dora_count = sum(1 for t in all_tiles if t.is_red)
 
     # Ura-dora only for riichi
     uradora_count = 0
@@ -93,92 +140,60 @@ def calculate_score(
             uradora_count += kita_count
 
     # Try all possible decompositions and pick the highest score
-    closed_34 = hand.to_34_array()
+    closed_34 = list(closed_key)
+    is_menzen = all(not m.is_open for m in melds)
+
+    def evaluate(head, mentsu_list, is_chiitoi, is_kokushi):
+        ctx = HandContext(
+            head_34=head,
+            mentsu=tuple(mentsu_list),
+            closed_tiles_34=closed_key,
+            melds=melds,
+            all_tiles_34=all_tiles_34,
+            win_tile_34=win_tile_34,
+            is_tsumo=is_tsumo,
+            is_menzen=is_menzen,
+            is_riichi=is_riichi,
+            is_double_riichi=is_double_riichi,
+            is_ippatsu=is_ippatsu,
+            seat_wind_34=seat_wind_34,
+            round_wind_34=round_wind_34,
+            is_haitei=is_haitei,
+            is_houtei=is_houtei,
+            is_rinshan=is_rinshan,
+            is_chankan=is_chankan,
+            is_tenhou=is_tenhou,
+            is_chiihou=is_chiihou,
+            is_chiitoi=is_chiitoi,
+            is_kokushi=is_kokushi,
+            dora_count=dora_count,
+            uradora_count=uradora_count,
+            red_dora_count=red_dora_count,
+        )
+        return _evaluate_context(ctx, is_dealer, honba, is_sanma)
 
     # Try standard decompositions
     decompositions = decompose_standard(closed_34)
     for head, mentsu_list in decompositions:
-        ctx = _build_context(
-            head, mentsu_list, hand, win_tile, is_tsumo,
-            seat_wind_34, round_wind_34, dora_count, uradora_count,
-            red_dora_count, is_riichi, is_double_riichi, is_ippatsu,
-            is_haitei, is_houtei, is_rinshan, is_chankan,
-            is_tenhou, is_chiihou, False, False,
-        )
-        result = _evaluate_context(ctx, is_dealer, honba, is_sanma)
+        result = evaluate(head, mentsu_list, False, False)
         if result and (best_result is None or result.total_points > best_result.total_points):
             best_result = result
 
     # Try chiitoi
-    if is_chiitoi_agari(closed_34) and len(hand.melds) == 0:
-        ctx = _build_context(
-            -1, [], hand, win_tile, is_tsumo,
-            seat_wind_34, round_wind_34, dora_count, uradora_count,
-            red_dora_count, is_riichi, is_double_riichi, is_ippatsu,
-            is_haitei, is_houtei, is_rinshan, is_chankan,
-            is_tenhou, is_chiihou, True, False,
-        )
-        result = _evaluate_context(ctx, is_dealer, honba, is_sanma)
+    if is_chiitoi_agari(closed_34) and len(melds) == 0:
+        result = evaluate(-1, [], True, False)
         if result and (best_result is None or result.total_points > best_result.total_points):
             best_result = result
 
     # Try kokushi
-    if is_kokushi_agari(closed_34) and len(hand.melds) == 0:
-        ctx = _build_context(
-            -1, [], hand, win_tile, is_tsumo,
-            seat_wind_34, round_wind_34, dora_count, uradora_count,
-            red_dora_count, is_riichi, is_double_riichi, is_ippatsu,
-            is_haitei, is_houtei, is_rinshan, is_chankan,
-            is_tenhou, is_chiihou, False, True,
-        )
-        result = _evaluate_context(ctx, is_dealer, honba, is_sanma)
+    if is_kokushi_agari(closed_34) and len(melds) == 0:
+        result = evaluate(-1, [], False, True)
         if result and (best_result is None or result.total_points > best_result.total_points):
             best_result = result
 
     return best_result
 
 
-def _build_context(
-    head, mentsu_list, hand, win_tile, is_tsumo,
-    seat_wind_34, round_wind_34, dora_count, uradora_count,
-    red_dora_count, is_riichi, is_double_riichi, is_ippatsu,
-    is_haitei, is_houtei, is_rinshan, is_chankan,
-    is_tenhou, is_chiihou, is_chiitoi, is_kokushi,
-) -> HandContext:
-    all_tiles = list(hand.closed_tiles)
-    for meld in hand.melds:
-        all_tiles.extend(meld.tiles)
-    all_tiles_34 = tiles_to_34_array(all_tiles)
-
-    ctx = HandContext(
-        head_34=head,
-        mentsu=mentsu_list,
-        closed_tiles_34=hand.to_34_array(),
-        melds=hand.melds,
-        all_tiles_34=all_tiles_34,
-        win_tile_34=win_tile.index34,
-        is_tsumo=is_tsumo,
-        is_menzen=hand.is_menzen,
-        is_riichi=is_riichi,
-        is_double_riichi=is_double_riichi,
-        is_ippatsu=is_ippatsu,
-        seat_wind_34=seat_wind_34,
-        round_wind_34=round_wind_34,
-        is_haitei=is_haitei,
-        is_houtei=is_houtei,
-        is_rinshan=is_rinshan,
-        is_chankan=is_chankan,
-        is_tenhou=is_tenhou,
-        is_chiihou=is_chiihou,
-        is_chiitoi=is_chiitoi,
-        is_kokushi=is_kokushi,
-        dora_count=dora_count,
-        uradora_count=uradora_count,
-        red_dora_count=red_dora_count,
-    )
-    return ctx
-
-
 def _evaluate_context(ctx: HandContext, is_dealer: bool, honba: int,
                       is_sanma: bool = False) -> Optional[ScoreResult]:
     """Evaluate a hand context and return ScoreResult or None."""
@@ -211,27 +226,30 @@ def _evaluate_context(ctx: HandContext, is_dealer: bool, honba: int,
     )
 
 
+# Base points for limit hands, indexed by han (5..13+); None below mangan
+_LIMIT_BASE_POINTS = (
+    None, None, None, None, None,
+    2000,              # 5: Mangan
+    3000, 3000,        # 6-7: Haneman
+    4000, 4000, 4000,  # 8-10: Baiman
+    6000, 6000,        # 11-12: Sanbaiman
+    8000,              # 13+: Yakuman
+)
+
+
 def _calculate_base_points(han: int, fu: int) -> int:
     """Calculate base points from han and fu."""
-    if han >= 13:
-        return 8000  # Yakuman
-    if han >= 11:
-        return 6000  # Sanbaiman
-    if han >= 8:
-        return 4000  # Baiman
-    if han >= 6:
-        return 3000  # Haneman
-    if han >= 5:
-        return 2000  # Mangan
-
-    base = fu * (2 ** (2 + han))
-    if base >= 2000:
-        return 2000  # Mangan
-    return base
+    limit = _LIMIT_BASE_POINTS[han if han < 13 else 13]
+    if limit is not None:
+        return limit
+    # fu * 2^(2+han), capped at mangan
+    base = fu << (2 + han)
+    return base if base < 2000 else 2000
 
 
 def _round_up_100(points: int) -> int:
-    return ((points + 99) // 100) * 100
+    """Round up to the next multiple of 100 (ceiling division, no branch)."""
+    return -(-points // 100) * 100
 
 
 def _build_score_result(
@@ -5,7 +5,9 @@ Shanten = minimum number of tiles needed to reach tenpai (waiting to win).
 0 means tenpai (one tile away).
 """
 
-from typing import List
+from functools import lru_cache
+from operator import itemgetter
+from typing import FrozenSet, List, Tuple
 
 
 def shanten(tiles_34: List[int]) -> int:
@@ -22,7 +24,14 @@ def shanten_standard(tiles_34: List[int]) -> int:
 
     Formula: shanten = (4 - mentsu) * 2 - 1 - partial
     where partial = taatsu (partial sequences) + pairs as head candidate.
+    Results are memoized on the 34 counts.
     """
+    return _shanten_standard(tuple(tiles_34))
+
+
+@lru_cache(maxsize=1 << 16)
+def _shanten_standard(counts: Tuple[int, ...]) -> int:
+    tiles_34 = list(counts)
     total = sum(tiles_34)
     # Number of mentsu we need from closed tiles
     # With N melds already called, we need (4-N) mentsu + 1 head from closed
@@ -53,91 +62,103 @@ def shanten_standard(tiles_34: List[int]) -> int:
     return max(best, -1)
 
 
+# (start, end, is_number) slices of the 34 array decomposed independently
+_SUIT_SLICES = ((0, 9, True), (9, 18, True), (18, 27, True), (27, 34, False))
+
+
 def _count_mentsu_and_partial(tiles_34: List[int], max_mentsu: int) -> tuple:
-    """Count mentsu and partial groups using backtracking.
+    """Count mentsu and partial groups that minimize shanten.
 
-    Returns (mentsu_count, partial_count) that minimizes shanten.
+    Returns (mentsu_count, partial_count). Suits are decomposed one at a
+    time in index order; each suit's reachable (mentsu, partial) gains are
+    looked up in a per-suit table keyed by its 9 (or 7 honor) counts and
+    the remaining mentsu/partial room, so the search over one suit is
+    shared by every hand (and every head choice) containing that suit.
     """
-    best = [0, 0]  # [mentsu, partial]
-    tiles = list(tiles_34)
-    _backtrack(tiles, 0, 0, 0, max_mentsu, best)
-    return best[0], best[1]
-
-
-def _backtrack(tiles: List[int], idx: int, mentsu: int, partial: int,
-               max_mentsu: int, best: List[int]):
-    """Backtrack to find optimal mentsu + partial decomposition."""
-    # Pruning: can't do better than current best
-    # shanten = (max_mentsu - mentsu) * 2 - 1 - partial  (with head)
-    # We want to minimize this, so maximize mentsu*2 + partial
-    current_score = mentsu * 2 + partial
-    best_score = best[0] * 2 + best[1]
-
-    # Upper bound: remaining could contribute at most remaining_tiles//3 mentsu
-    # + remaining pairs/sequences as partial
-    if idx >= 34:
-        if current_score > best_score:
-            best[0] = mentsu
-            best[1] = partial
-        return
-
-    # Skip if this tile count is 0
-    if tiles[idx] == 0:
-        _backtrack(tiles, idx + 1, mentsu, partial, max_mentsu, best)
-        return
-
-    # Cap: mentsu + partial <= max_mentsu (4 or fewer groups needed)
-    can_add_mentsu = mentsu < max_mentsu
-    can_add_partial = (mentsu + partial) < max_mentsu
-
-    found_group = False
+    states = {(0, 0)}
+    for start, end, is_number in _SUIT_SLICES:
+        counts = tuple(tiles_34[start:end])
+        if not any(counts):
+            continue
+        next_states = set()
+        for mentsu, partial in states:
+            gains = _suit_gains(counts, is_number, max_mentsu - mentsu,
+                                max(max_mentsu - mentsu - partial, 0))
+            for d_mentsu, d_partial in gains:
+                next_states.add((mentsu + d_mentsu, partial + d_partial))
+        states = next_states
+
+    # Shanten depends only on mentsu * 2 + partial
+    return max(states, key=lambda s: s[0] * 2 + s[1])
+
+
+# Gains of an empty (or exhausted) suit
+_NO_GAINS = frozenset({(0, 0)})
+
+
+@lru_cache(maxsize=1 << 17)
+def _suit_gains(counts: Tuple[int, ...], is_number: bool, mentsu_room: int,
+                partial_room: int) -> FrozenSet[Tuple[int, int]]:
+    """All (mentsu, partial) gains reachable within one suit.
+
+    counts holds the suit from the current tile onward, so a sequence
+    starting here fits while at least 3 (taatsu: 2) tiles remain. A mentsu
+    may be added while mentsu_room > 0, a partial while partial_room > 0;
+    every group uses up one unit of partial_room. Sub-suffixes recurse
+    through this same cache, so shared tails are searched once.
+    """
+    # Skip tiles with count 0
+    start = 0
+    size = len(counts)
+    while start < size and counts[start] == 0:
+        start += 1
+    if start == size:
+        return _NO_GAINS
+    if start:
+        return _suit_gains(counts[start:], is_number, mentsu_room, partial_room)
+
+    first = counts[0]
+    rest = counts[1:]
+    gains = set()
+
+    def add(sub_counts, d_mentsu, d_partial):
+        sub = _suit_gains(sub_counts, is_number, mentsu_room - d_mentsu,
+                          max(partial_room - 1, 0))
+        for m, p in sub:
+            gains.add((m + d_mentsu, p + d_partial))
+
+    # Room budgets: a mentsu needs mentsu_room left, a partial needs
+    # partial_room left (groups beyond the mentsu still needed don't help)
+    can_add_mentsu = mentsu_room > 0
+    can_add_partial = partial_room > 0
 
     # Try koutsu (triplet)
-    if tiles[idx] >= 3 and can_add_mentsu:
-        found_group = True
-        tiles[idx] -= 3
-        _backtrack(tiles, idx, mentsu + 1, partial, max_mentsu, best)
-        tiles[idx] += 3
+    if first >= 3 and can_add_mentsu:
+        add((first - 3,) + rest, 1, 0)
 
     # Try shuntsu (sequence) for number tiles
-    if idx < 27 and idx % 9 <= 6 and can_add_mentsu:
-        if tiles[idx] >= 1 and tiles[idx + 1] >= 1 and tiles[idx + 2] >= 1:
-            found_group = True
-            tiles[idx] -= 1
-            tiles[idx + 1] -= 1
-            tiles[idx + 2] -= 1
-            _backtrack(tiles, idx, mentsu + 1, partial, max_mentsu, best)
-            tiles[idx] += 1
-            tiles[idx + 1] += 1
-            tiles[idx + 2] += 1
+    if is_number and size >= 3 and can_add_mentsu:
+        if counts[1] >= 1 and counts[2] >= 1:
+            add((first - 1, counts[1] - 1, counts[2] - 1) + counts[3:], 1, 0)
 
     # Try partial groups (taatsu)
     # Pair
-    if tiles[idx] >= 2 and can_add_partial:
-        tiles[idx] -= 2
-        _backtrack(tiles, idx, mentsu, partial + 1, max_mentsu, best)
-        tiles[idx] += 2
+    if first >= 2 and can_add_partial:
+        add((first - 2,) + rest, 0, 1)
 
     # Adjacent pair (e.g., 12, 23) for number tiles
-    if idx < 27 and idx % 9 <= 7 and can_add_partial:
-        if tiles[idx] >= 1 and tiles[idx + 1] >= 1:
-            tiles[idx] -= 1
-            tiles[idx + 1] -= 1
-            _backtrack(tiles, idx, mentsu, partial + 1, max_mentsu, best)
-            tiles[idx] += 1
-            tiles[idx + 1] += 1
+    if is_number and size >= 2 and can_add_partial:
+        if counts[1] >= 1:
+            add((first - 1, counts[1] - 1) + counts[2:], 0, 1)
 
     # Gap pair (e.g., 13, 24) for number tiles
-    if idx < 27 and idx % 9 <= 6 and can_add_partial:
-        if tiles[idx] >= 1 and tiles[idx + 2] >= 1:
-            tiles[idx] -= 1
-            tiles[idx + 2] -= 1
-            _backtrack(tiles, idx, mentsu, partial + 1, max_mentsu, best)
-            tiles[idx] += 1
-            tiles[idx + 2] += 1
+    if is_number and size >= 3 and can_add_partial:
+        if counts[2] >= 1:
+            add((first - 1, counts[1], counts[2] - 1) + counts[3:], 0, 1)
 
     # Skip this tile entirely
-    _backtrack(tiles, idx + 1, mentsu, partial, max_mentsu, best)
+    gains.update(_suit_gains(rest, is_number, mentsu_room, partial_room))
+    return frozenset(gains)
 
 
 def shanten_chiitoi(tiles_34: List[int]) -> int:
@@ -150,9 +171,10 @@ def shanten_chiitoi(tiles_34: List[int]) -> int:
     if total not in (13, 14):
         return 99  # Not applicable with melds
 
-    pairs = sum(1 for c in tiles_34 if c >= 2)
-    # Count unique types that contribute
-    kinds = sum(1 for c in tiles_34 if c >= 1)
+    # Count unique types that contribute, and how many of them are pairs
+    # (list.count runs in C, one pass per value)
+    kinds = 34 - tiles_34.count(0)
+    pairs = kinds - tiles_34.count(1)
 
     s = 6 - pairs
     # If we don't have 7 different types, we need extra tiles
@@ -161,6 +183,10 @@ def shanten_chiitoi(tiles_34: List[int]) -> int:
     return s
 
 
+# Picks the 13 yaochu counts out of a 34 array in one call
+_YAOCHU_COUNTS = itemgetter(0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33)
+
+
 def shanten_kokushi(tiles_34: List[int]) -> int:
     """Shanten for thirteen orphans (国士無双).
 
@@ -171,8 +197,8 @@ def shanten_kokushi(tiles_34: List[int]) -> int:
     if total not in (13, 14):
         return 99
 
-    yaochu = [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33]
-    types = sum(1 for idx in yaochu if tiles_34[idx] >= 1)
-    has_pair = any(tiles_34[idx] >= 2 for idx in yaochu)
+    yaochu_counts = _YAOCHU_COUNTS(tiles_34)
+    types = 13 - yaochu_counts.count(0)
+    has_pair = max(yaochu_counts) >= 2
 
     return 13 - types - (1 if has_pair else 0)
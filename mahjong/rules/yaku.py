@@ -3,7 +3,8 @@
 Each yaku function takes a HandContext and returns (yaku_name, han_value) or None.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Optional, Set
 
 from mahjong.core.tile import Tile, YAOCHU_INDICES, tiles_to_34_array
@@ -11,16 +12,16 @@ from mahjong.core.meld import Meld, MeldType
 from mahjong.rules.agari import Decomposition
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HandContext:
-    """All information needed to judge yaku."""
+    """All information needed to judge yaku. Immutable and hashable."""
     # Decomposition
     head_34: int = -1
-    mentsu: List[Tuple[str, int]] = field(default_factory=list)
+    mentsu: Tuple[Tuple[str, int], ...] = ()
     # Hand info
-    closed_tiles_34: List[int] = field(default_factory=lambda: [0]*34)
-    melds: List[Meld] = field(default_factory=list)
-    all_tiles_34: List[int] = field(default_factory=lambda: [0]*34)
+    closed_tiles_34: Tuple[int, ...] = (0,) * 34
+    melds: Tuple[Meld, ...] = ()
+    all_tiles_34: Tuple[int, ...] = (0,) * 34
     # Win info
     win_tile_34: int = -1
     is_tsumo: bool = False
@@ -46,6 +47,14 @@ class HandContext:
     uradora_count: int = 0
     red_dora_count: int = 0
 
+    def __post_init__(self):
+        # Accept lists for the sequence fields but store tuples, so every
+        # context is hashable (and _present_mask can cache on all_tiles_34)
+        for name in ('mentsu', 'closed_tiles_34', 'melds', 'all_tiles_34'):
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, tuple(value))
+
     @property
     def all_mentsu(self) -> List[Tuple[str, int]]:
         """All mentsu including those from melds."""
@@ -63,6 +72,44 @@ class HandContext:
 YakuResult = Tuple[str, int]  # (name, han)
 
 
+def _bits(indices) -> int:
+    """Bitmask with bit i set for each 34-index i."""
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+
+# Tile-class masks over the 34 indices (bit i = tile index i)
+_MAN_MASK = _bits(range(0, 9))
+_PIN_MASK = _bits(range(9, 18))
+_SOU_MASK = _bits(range(18, 27))
+_NUMBER_MASK = _MAN_MASK | _PIN_MASK | _SOU_MASK
+_HONOR_MASK = _bits(range(27, 34))
+_YAOCHU_MASK = _bits(YAOCHU_INDICES)
+_TERMINAL_MASK = _YAOCHU_MASK & _NUMBER_MASK
+_GREEN_MASK = _bits((19, 20, 21, 23, 25, 32))  # 2s,3s,4s,6s,8s,發
+
+
+@lru_cache(maxsize=1 << 12)
+def _present_mask(tiles_34: Tuple[int, ...]) -> int:
+    """Bitmask of the 34 indices with a nonzero count.
+
+    Cached on the counts, so the tile-class checks share one scan per hand.
+    """
+    mask = 0
+    for i, c in enumerate(tiles_34):
+        if c:
+            mask |= 1 << i
+    return mask
+
+
+def _suit_count(present: int) -> int:
+    """Number of number-tile suits present in a presence mask."""
+    return ((present & _MAN_MASK) != 0) + ((present & _PIN_MASK) != 0) \
+        + ((present & _SOU_MASK) != 0)
+
+
 def detect_all_yaku(ctx: HandContext) -> List[YakuResult]:
     """Detect all applicable yaku for the given hand context."""
     results = []
@@ -169,9 +216,8 @@ def check_tsumo(ctx: HandContext) -> Optional[YakuResult]:
 
 def check_tanyao(ctx: HandContext) -> Optional[YakuResult]:
     """All simples (断幺九) - no terminals or honors."""
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0 and i in YAOCHU_INDICES:
-            return None
+    if _present_mask(ctx.all_tiles_34) & _YAOCHU_MASK:
+        return None
     return ("断幺九", 1)
 
 def check_pinfu(ctx: HandContext) -> Optional[YakuResult]:
@@ -370,34 +416,35 @@ def check_junchan(ctx: HandContext) -> Optional[YakuResult]:
     return ("純全帯幺九", han)
 
 
-def check_ittsu(ctx: HandContext) -> Optional[YakuResult]:
-    """Straight (一気通貫). 123+456+789 of one suit."""
-    shuntsu_set = set()
-    for m_type, m_idx in ctx.all_mentsu:
+def _shuntsu_mask(mentsu) -> int:
+    """Bitmask of shuntsu start indices (bit i = shuntsu starting at i)."""
+    mask = 0
+    for m_type, m_idx in mentsu:
         if m_type == 'shuntsu':
-            shuntsu_set.add(m_idx)
+            mask |= 1 << m_idx
+    return mask
 
-    for suit_start in (0, 9, 18):
-        if (suit_start in shuntsu_set and
-            suit_start + 3 in shuntsu_set and
-            suit_start + 6 in shuntsu_set):
-            han = 1 if not ctx.is_menzen else 2
-            return ("一気通貫", han)
+
+_SUIT_STARTS_MASK = _bits((0, 9, 18))
+
+
+def check_ittsu(ctx: HandContext) -> Optional[YakuResult]:
+    """Straight (一気通貫). 123+456+789 of one suit."""
+    m = _shuntsu_mask(ctx.all_mentsu)
+    # Bit at a suit start survives only if 123, 456 and 789 are all present
+    if m & (m >> 3) & (m >> 6) & _SUIT_STARTS_MASK:
+        han = 1 if not ctx.is_menzen else 2
+        return ("一気通貫", han)
     return None
 
 
 def check_sanshoku_doujun(ctx: HandContext) -> Optional[YakuResult]:
     """Three-colored straight (三色同順). Same sequence in all 3 suits."""
-    shuntsu_list = [m[1] for m in ctx.all_mentsu if m[0] == 'shuntsu']
-
-    for s in shuntsu_list:
-        if s >= 9:
-            continue
-        base = s % 9
-        if (base in shuntsu_list or s in shuntsu_list):
-            if (base + 9) in shuntsu_list and (base + 18) in shuntsu_list and base in shuntsu_list:
-                han = 1 if not ctx.is_menzen else 2
-                return ("三色同順", han)
+    m = _shuntsu_mask(ctx.all_mentsu)
+    # Align the pin and sou starts onto the man starts
+    if m & (m >> 9) & (m >> 18) & _MAN_MASK:
+        han = 1 if not ctx.is_menzen else 2
+        return ("三色同順", han)
     return None
 
 
@@ -425,42 +472,53 @@ def check_toitoi(ctx: HandContext) -> Optional[YakuResult]:
     return None
 
 
+def _koutsu_mask(mentsu) -> int:
+    """Bitmask of koutsu indices (bit i = koutsu of tile i)."""
+    mask = 0
+    for m_type, m_idx in mentsu:
+        if m_type == 'koutsu':
+            mask |= 1 << m_idx
+    return mask
+
+
+def _ankan_mask(melds) -> int:
+    """Bitmask of ankan tile indices."""
+    mask = 0
+    for m in melds:
+        if m.meld_type == MeldType.ANKAN:
+            mask |= 1 << m.tile_index34
+    return mask
+
+
 def check_sanankou(ctx: HandContext) -> Optional[YakuResult]:
     """Three concealed triplets (三暗刻)."""
     if ctx.is_chiitoi:
         return None
-    # Count closed koutsu from decomposition
-    closed_koutsu = sum(1 for m_type, _ in ctx.mentsu if m_type == 'koutsu')
-    # Ankan also counts
-    closed_koutsu += sum(1 for m in ctx.melds if m.meld_type == MeldType.ANKAN)
+    # Closed koutsu from decomposition
+    closed = _koutsu_mask(ctx.mentsu)
 
     # Special case: if ron on a shanpon wait, one of the koutsu is "open"
     if not ctx.is_tsumo:
         win_in_shuntsu = any(
-            m_type == 'shuntsu' and ctx.win_tile_34 in (m_idx, m_idx + 1, m_idx + 2)
+            m_type == 'shuntsu' and m_idx <= ctx.win_tile_34 <= m_idx + 2
             for m_type, m_idx in ctx.mentsu
         )
-        # Check if win tile forms one of the closed koutsu
-        for m_type, m_idx in ctx.mentsu:
-            if (m_type == 'koutsu' and m_idx == ctx.win_tile_34
-                    and not win_in_shuntsu):
-                closed_koutsu -= 1
-                break
-
-    if closed_koutsu == 3:
+        if not win_in_shuntsu:
+            closed &= ~(1 << ctx.win_tile_34)
+
+    # Ankan also counts
+    if (closed | _ankan_mask(ctx.melds)).bit_count() == 3:
         return ("三暗刻", 2)
     return None
 
 
 def check_honroutou(ctx: HandContext) -> Optional[YakuResult]:
     """All terminals and honors (混老頭)."""
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0 and i not in YAOCHU_INDICES:
-            return None
+    present = _present_mask(ctx.all_tiles_34)
+    if present & ~_YAOCHU_MASK:
+        return None
     # Must have both terminals and honors
-    has_terminal = any(ctx.all_tiles_34[i] > 0 for i in YAOCHU_INDICES if i < 27)
-    has_honor = any(ctx.all_tiles_34[i] > 0 for i in range(27, 34))
-    if has_terminal and has_honor:
+    if present & _TERMINAL_MASK and present & _HONOR_MASK:
         return ("混老頭", 2)
     return None
 
@@ -484,20 +542,8 @@ def check_chiitoi(ctx: HandContext) -> Optional[YakuResult]:
 
 def check_honitsu(ctx: HandContext) -> Optional[YakuResult]:
     """Half flush (混一色). One suit + honors."""
-    suits_present = set()
-    has_honor = False
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0:
-            if i < 9:
-                suits_present.add('m')
-            elif i < 18:
-                suits_present.add('p')
-            elif i < 27:
-                suits_present.add('s')
-            else:
-                has_honor = True
-
-    if len(suits_present) == 1 and has_honor:
+    present = _present_mask(ctx.all_tiles_34)
+    if _suit_count(present) == 1 and present & _HONOR_MASK:
         han = 2 if not ctx.is_menzen else 3
         return ("混一色", han)
     return None
@@ -505,20 +551,8 @@ def check_honitsu(ctx: HandContext) -> Optional[YakuResult]:
 
 def check_chinitsu(ctx: HandContext) -> Optional[YakuResult]:
     """Full flush (清一色). One suit only, no honors."""
-    suits_present = set()
-    has_honor = False
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0:
-            if i < 9:
-                suits_present.add('m')
-            elif i < 18:
-                suits_present.add('p')
-            elif i < 27:
-                suits_present.add('s')
-            else:
-                has_honor = True
-
-    if len(suits_present) == 1 and not has_honor:
+    present = _present_mask(ctx.all_tiles_34)
+    if _suit_count(present) == 1 and not present & _HONOR_MASK:
         han = 5 if not ctx.is_menzen else 6
         return ("清一色", han)
     return None
@@ -530,16 +564,11 @@ def check_suuankou(ctx: HandContext) -> Optional[YakuResult]:
     """Four concealed triplets (四暗刻)."""
     if ctx.is_chiitoi or ctx.is_kokushi:
         return None
-    closed_koutsu = sum(1 for m_type, _ in ctx.mentsu if m_type == 'koutsu')
-    closed_koutsu += sum(1 for m in ctx.melds if m.meld_type == MeldType.ANKAN)
-
+    closed = _koutsu_mask(ctx.mentsu)
     if not ctx.is_tsumo:
-        for m_type, m_idx in ctx.mentsu:
-            if m_type == 'koutsu' and m_idx == ctx.win_tile_34:
-                closed_koutsu -= 1
-                break
+        closed &= ~(1 << ctx.win_tile_34)
 
-    if closed_koutsu == 4:
+    if (closed | _ankan_mask(ctx.melds)).bit_count() == 4:
         return ("四暗刻", 13)
     return None
 
@@ -574,64 +603,45 @@ def check_daisuushii(ctx: HandContext) -> Optional[YakuResult]:
 
 def check_tsuuiisou(ctx: HandContext) -> Optional[YakuResult]:
     """All honors (字一色)."""
-    for i in range(27):
-        if ctx.all_tiles_34[i] > 0:
-            return None
+    if _present_mask(ctx.all_tiles_34) & _NUMBER_MASK:
+        return None
     return ("字一色", 13)
 
 
 def check_chinroutou(ctx: HandContext) -> Optional[YakuResult]:
     """All terminals (清老頭)."""
-    terminal_indices = {0, 8, 9, 17, 18, 26}
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0 and i not in terminal_indices:
-            return None
+    if _present_mask(ctx.all_tiles_34) & ~_TERMINAL_MASK:
+        return None
     return ("清老頭", 13)
 
 
 def check_ryuuiisou(ctx: HandContext) -> Optional[YakuResult]:
     """All green (緑一色). Only 2s,3s,4s,6s,8s + hatsu."""
-    green_indices = {19, 20, 21, 23, 25, 32}  # 2s,3s,4s,6s,8s,發
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0 and i not in green_indices:
-            return None
+    if _present_mask(ctx.all_tiles_34) & ~_GREEN_MASK:
+        return None
     return ("緑一色", 13)
 
 
+_CHUUREN_BASE = (3, 1, 1, 1, 1, 1, 1, 1, 3)
+
+
 def check_chuuren(ctx: HandContext) -> Optional[YakuResult]:
     """Nine gates (九蓮宝燈). Menzen only, one suit: 1112345678999+1."""
     if not ctx.is_menzen:
         return None
-    # Determine suit
-    suit_start = -1
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0:
-            if i < 9:
-                suit_start = 0
-            elif i < 18:
-                suit_start = 9
-            elif i < 27:
-                suit_start = 18
-            else:
-                return None
+    # All tiles must be in one suit
+    present = _present_mask(ctx.all_tiles_34)
+    for suit_start, suit_mask in ((0, _MAN_MASK), (9, _PIN_MASK), (18, _SOU_MASK)):
+        if present and not present & ~suit_mask:
             break
-
-    if suit_start < 0:
+    else:
         return None
 
-    # All tiles must be in one suit
-    for i in range(34):
-        if ctx.all_tiles_34[i] > 0:
-            if not (suit_start <= i < suit_start + 9):
-                return None
-
     # Must have at least: 3,1,1,1,1,1,1,1,3 of 1-9
-    required = [3, 1, 1, 1, 1, 1, 1, 1, 3]
-    for j in range(9):
-        if ctx.all_tiles_34[suit_start + j] < required[j]:
-            return None
-
-    return ("九蓮宝燈", 13)
+    suit_counts = ctx.all_tiles_34[suit_start:suit_start + 9]
+    if all(c >= r for c, r in zip(suit_counts, _CHUUREN_BASE)):
+        return ("九蓮宝燈", 13)
+    return None
 
 
 def check_suukantsu(ctx: HandContext) -> Optional[YakuResult]:
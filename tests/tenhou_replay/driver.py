@@ -8,7 +8,7 @@ Core flow per round:
   5. Verify final scores on AGARI/RYUUKYOKU
 """
 
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence
 
 from mahjong.core.tile import Tile, ALL_TILES_136
 from mahjong.core.meld import Meld, MeldType
@@ -16,12 +16,12 @@ from mahjong.core.hand import Hand
 from mahjong.core.wall import Wall
 from mahjong.core.player_state import PlayerState, Wind
 from mahjong.engine.round import RoundState, RoundResult
-from mahjong.engine.action import ActionType
+from mahjong.engine.action import Action, ActionType, AvailableActions
 from mahjong.engine.event import EventBus
 from mahjong.rules.scoring import calculate_score
 
 from .parser import RoundData, Event, EventType
-from .decoder import TenhouMeldType
+from .decoder import TenhouMeldType, DecodedMeld
 from .wall_builder import build_wall
 from .verifier import (
     ReplayVerificationError,
@@ -30,14 +30,25 @@ from .verifier import (
     verify_score_changes,
 )
 
+# Meld types that are followed by a rinshan draw (kans from the dead wall,
+# kita from the live wall)
+_RINSHAN_MELDS = frozenset({
+    TenhouMeldType.ANKAN, TenhouMeldType.DAIMINKAN, TenhouMeldType.KAKAN,
+    TenhouMeldType.KITA,
+})
 
-def replay_round(rd: RoundData, round_index: int = 0):
+# Wind members indexed by value, to skip the enum lookup per player
+_WINDS = (Wind.EAST, Wind.SOUTH, Wind.WEST, Wind.NORTH)
+
+
+def replay_round(rd: RoundData, round_index: int = 0) -> None:
     """Replay a single round from parsed XML data.
 
     Raises ReplayVerificationError on any mismatch.
     """
     num_players = rd.num_players
     is_sanma = rd.is_sanma
+    TILES = ALL_TILES_136  # local binding for the per-event lookups
 
     # 1. Build wall
     live_tiles, dead_tiles, dora_revealed = build_wall(rd)
@@ -56,11 +67,11 @@ def replay_round(rd: RoundData, round_index: int = 0):
 
     # 3. Set up seat winds and dealer
     # round_number: 0=E1, 1=E2, ..., 4=S1, ...
-    round_wind = Wind(rd.round_number // 4)
+    round_wind = _WINDS[rd.round_number // 4]
     dealer = rd.dealer
 
     for i in range(num_players):
-        seat_wind = Wind((i - dealer) % num_players)
+        seat_wind = _WINDS[(i - dealer) % num_players]
         players[i].seat_wind = seat_wind
         players[i].is_dealer = (i == dealer)
 
@@ -77,37 +88,49 @@ def replay_round(rd: RoundData, round_index: int = 0):
     )
 
     # 5. Set initial hands directly (bypass deal_tiles)
+    # Hand.draw appends without re-sorting, so one sort after dealing suffices.
+    # extend() fills the hand's own list in place in a single C-level call.
     for i in range(num_players):
-        for tile_id in rd.hands[i]:
-            tile = ALL_TILES_136[tile_id]
-            rs.players[i].hand.closed_tiles.append(tile)
-        rs.players[i].hand.sort_closed()
-        rs.players[i].hand.draw_tile = None
+        hand = players[i].hand
+        hand.add_closed_tiles(map(TILES.__getitem__, rd.hands[i]))
+        hand.sort_closed()
+        hand.draw_tile = None
 
     # 6. Process events sequentially
-    riichi_pending = {}  # player -> True when REACH step=1 seen, awaiting discard
-    riichi_pending_double = {}  # player -> is_double_riichi at step=1
-    riichi_pending_blocked = {}  # player -> ippatsu cancelled before step=2
-    riichi_pending_candidates = {}  # player -> riichi discard candidates
+    # Per-player riichi flags packed as bitmasks (bit i = player i)
+    riichi_pending_mask = 0  # REACH step=1 seen, awaiting discard
+    riichi_pending_double_mask = 0  # is_double_riichi at step=1
+    riichi_pending_blocked_mask = 0  # ippatsu cancelled before step=2
+    riichi_pending_candidates = {}  # player -> index34 set of riichi discards
     last_draw_available = {}  # player -> AvailableActions from last draw
     expect_rinshan = False  # True when next draw should be treated as rinshan
     rinshan_from_live = False  # True when rinshan draw comes from live wall (kita)
-    step = 0
 
     last_was_agari = False
     pending_temp_furiten = None  # (discard_player, tile) awaiting confirmation
-    for event in rd.events:
+    # Enum members are singletons: bind them locally and dispatch with `is`.
+    # DRAW/DISCARD dominate and are tested first; the rarer branches stay in
+    # the chain because they update the loop-local riichi/rinshan state.
+    DRAW = EventType.DRAW
+    DISCARD = EventType.DISCARD
+    MELD = EventType.MELD
+    RIICHI_DECLARE = EventType.RIICHI_DECLARE
+    RIICHI_SCORE = EventType.RIICHI_SCORE
+    AGARI = EventType.AGARI
+    RYUUKYOKU = EventType.RYUUKYOKU
+    events = tuple(rd.events)
+    for step, event in enumerate(events):
         step_desc = f"R{round_index} step {step}"
-        step += 1
+        et = event.event_type
 
         # Apply deferred temp furiten: if the previous discard was NOT
         # followed by an AGARI, now commit the temp furiten update.
-        if event.event_type != EventType.AGARI and pending_temp_furiten is not None:
+        if pending_temp_furiten is not None and et is not AGARI:
             dp, dt = pending_temp_furiten
             rs.update_temp_furiten(dp, dt)
             pending_temp_furiten = None
 
-        if event.event_type == EventType.DRAW:
+        if et is DRAW:
             last_was_agari = False
             player = event.player
             tile_id = event.tile_id
@@ -125,10 +148,10 @@ def replay_round(rd: RoundData, round_index: int = 0):
                     raise ReplayVerificationError(
                         f"[{step_desc}] Cannot draw rinshan for player {player}"
                     )
-                rs.players[player].hand.draw(tile)
+                players[player].hand.draw(tile)
                 # Reveal pending kakan dora after replacement draw
                 if rs.pending_kakan_dora > 0:
-                    rs.wall.reveal_new_dora()
+                    wall.reveal_new_dora()
                     rs.pending_kakan_dora -= 1
             else:
                 # Normal draw from live wall
@@ -141,7 +164,7 @@ def replay_round(rd: RoundData, round_index: int = 0):
                     raise ReplayVerificationError(
                         f"[{step_desc}] Wall empty, cannot draw for player {player}"
                     )
-                rs.players[player].hand.draw(tile)
+                players[player].hand.draw(tile)
 
                 # Check haitei
                 rs.is_haitei = wall.remaining == 0
@@ -153,14 +176,14 @@ def replay_round(rd: RoundData, round_index: int = 0):
                 raise ReplayVerificationError(
                     f"[{step_desc}] Player {player} drew tile {tile.id} "
                     f"({tile.name}), expected {tile_id} "
-                    f"({ALL_TILES_136[tile_id].name})"
+                    f"({TILES[tile_id].name})"
                 )
 
-        elif event.event_type == EventType.DISCARD:
+        elif et is DISCARD:
             last_was_agari = False
             player = event.player
             tile_id = event.tile_id
-            tile = ALL_TILES_136[tile_id]
+            tile = TILES[tile_id]
 
             # Verify discard is legal
             available = last_draw_available.get(player)
@@ -171,17 +194,15 @@ def replay_round(rd: RoundData, round_index: int = 0):
                     )
             else:
                 # After call (no draw), must discard from hand
-                if tile not in rs.players[player].hand.closed_tiles:
+                if tile not in players[player].hand.closed_tiles:
                     raise ReplayVerificationError(
                         f"[{step_desc}] Illegal discard: {tile.name} not in hand"
                     )
 
             # If riichi pending, discard must be a riichi candidate
             # Compare by index34 since red/non-red variants are equivalent
-            if riichi_pending.get(player):
-                candidates = riichi_pending_candidates.get(player, [])
-                candidate_indices = set(t.index34 for t in candidates)
-                if tile.index34 not in candidate_indices:
+            if riichi_pending_mask & (1 << player):
+                if tile.index34 not in riichi_pending_candidates.get(player, ()):
                     raise ReplayVerificationError(
                         f"[{step_desc}] Illegal riichi discard: {tile.name}"
                     )
@@ -197,53 +218,55 @@ def replay_round(rd: RoundData, round_index: int = 0):
             pending_temp_furiten = (player, tile)
             last_draw_available.pop(player, None)
 
-        elif event.event_type == EventType.MELD:
+        elif et is MELD:
             last_was_agari = False
             _verify_meld_available(rs, event, step_desc, last_draw_available)
             _process_meld_event(rs, event, step_desc)
             # Any call/kan/kita cancels ippatsu for pending riichi
-            if riichi_pending:
-                for p in list(riichi_pending.keys()):
-                    riichi_pending_blocked[p] = True
+            riichi_pending_blocked_mask |= riichi_pending_mask
             # After kan or kita, next draw is a rinshan draw
-            if event.decoded_meld and event.decoded_meld.meld_type in (
-                TenhouMeldType.ANKAN, TenhouMeldType.DAIMINKAN,
-                TenhouMeldType.KAKAN,
-            ):
-                expect_rinshan = True
-            elif event.decoded_meld and event.decoded_meld.meld_type == TenhouMeldType.KITA:
-                expect_rinshan = True
-                rinshan_from_live = True
+            dm = event.decoded_meld
+            if dm is not None:
+                meld_type = dm.meld_type
+                if meld_type in _RINSHAN_MELDS:
+                    expect_rinshan = True
+                    if meld_type == TenhouMeldType.KITA:
+                        rinshan_from_live = True
             last_draw_available.pop(event.player, None)
 
-        elif event.event_type == EventType.RIICHI_DECLARE:
+        elif et is RIICHI_DECLARE:
             last_was_agari = False
             # Just record intent; actual riichi finalized on step=2
-            riichi_pending[event.player] = True
-            available = rs.get_draw_actions(event.player)
+            player = event.player
+            riichi_pending_mask |= 1 << player
+            available = rs.get_draw_actions(player)
             if not available.can_riichi:
                 raise ReplayVerificationError(
                     f"[{step_desc}] Illegal riichi: can_riichi is False"
                 )
-            riichi_pending_candidates[event.player] = list(available.riichi_candidates)
+            riichi_pending_candidates[player] = frozenset(
+                t.index34 for t in available.riichi_candidates)
             # Record double-riichi eligibility at declaration time
-            no_calls = all(len(p.hand.melds) == 0 for p in rs.players)
-            if rs.is_sanma:
-                no_calls = no_calls and all(len(p.kita_tiles) == 0 for p in rs.players)
-            riichi_pending_double[event.player] = (
-                rs.first_draw[event.player] and no_calls
-            )
+            no_calls = all(len(p.hand.melds) == 0 for p in players)
+            if is_sanma:
+                no_calls = no_calls and all(len(p.kita_tiles) == 0 for p in players)
+            if rs.first_draw[player] and no_calls:
+                riichi_pending_double_mask |= 1 << player
 
-        elif event.event_type == EventType.RIICHI_SCORE:
+        elif et is RIICHI_SCORE:
             last_was_agari = False
             # Riichi confirmed (no one ronned the discard).
             # Now apply riichi flags and score deduction.
             player = event.player
-            riichi_pending.pop(player, None)
-            is_double = riichi_pending_double.pop(player, False)
-            ippatsu_blocked = riichi_pending_blocked.pop(player, False)
+            bit = 1 << player
+            is_double = bool(riichi_pending_double_mask & bit)
+            ippatsu_blocked = bool(riichi_pending_blocked_mask & bit)
+            riichi_pending_mask &= ~bit
+            riichi_pending_double_mask &= ~bit
+            riichi_pending_blocked_mask &= ~bit
             riichi_pending_candidates.pop(player, None)
-            hand = rs.players[player].hand
+            p = players[player]
+            hand = p.hand
 
             hand.is_riichi = True
             hand.is_ippatsu = not ippatsu_blocked
@@ -251,12 +274,12 @@ def replay_round(rd: RoundData, round_index: int = 0):
                 hand.is_double_riichi = True
 
             rs.riichi_declared_count += 1
-            rs.players[player].score -= 1000
+            p.score -= 1000
             rs.riichi_sticks += 1
 
             hand.riichi_discard_index = len(hand.discard_pool) - 1
 
-        elif event.event_type == EventType.AGARI:
+        elif et is AGARI:
             if expect_rinshan:
                 # Chankan (robbed kan) can end the hand before rinshan draw
                 expect_rinshan = False
@@ -264,7 +287,7 @@ def replay_round(rd: RoundData, round_index: int = 0):
             winner = event.agari_who
             from_who = event.agari_from
             is_tsumo = (winner == from_who)
-            win_tile = ALL_TILES_136[event.agari_machi]
+            win_tile = TILES[event.agari_machi]
             if is_tsumo:
                 available = rs.get_draw_actions(winner)
                 if not available.can_tsumo:
@@ -280,42 +303,42 @@ def replay_round(rd: RoundData, round_index: int = 0):
             _verify_agari(rs, rd, event, step_desc, is_secondary_ron=last_was_agari)
             last_was_agari = True
 
-        elif event.event_type == EventType.RYUUKYOKU:
+        elif et is RYUUKYOKU:
             last_was_agari = False
             _verify_ryuukyoku(rs, rd, event, step_desc)
 
 
-def _process_meld_event(rs: RoundState, event: Event, step_desc: str):
+def _process_meld_event(rs: RoundState, event: Event, step_desc: str) -> None:
     """Process a meld (call) event."""
     dm = event.decoded_meld
     player = event.player
+    # One index34 bucket of the caller's hand, shared by the typed helpers
+    bucket = _bucket_by_34(rs.players[player].hand.closed_tiles)
 
     if dm.meld_type == TenhouMeldType.CHI:
-        _process_chi(rs, player, dm, step_desc)
+        _process_chi(rs, player, dm, bucket, step_desc)
     elif dm.meld_type == TenhouMeldType.PON:
-        _process_pon(rs, player, dm, step_desc)
+        _process_pon(rs, player, dm, bucket, step_desc)
     elif dm.meld_type == TenhouMeldType.DAIMINKAN:
-        _process_daiminkan(rs, player, dm, step_desc)
+        _process_daiminkan(rs, player, dm, bucket, step_desc)
     elif dm.meld_type == TenhouMeldType.ANKAN:
-        _process_ankan(rs, player, dm, step_desc)
+        _process_ankan(rs, player, dm, bucket, step_desc)
     elif dm.meld_type == TenhouMeldType.KAKAN:
-        _process_kakan(rs, player, dm, step_desc)
+        _process_kakan(rs, player, dm, bucket, step_desc)
     elif dm.meld_type == TenhouMeldType.KITA:
-        _process_kita(rs, player, dm, step_desc)
+        _process_kita(rs, player, dm, bucket, step_desc)
 
 
 def _verify_meld_available(rs: RoundState, event: Event, step_desc: str,
-                           last_draw_available):
+                           last_draw_available: Dict[int, AvailableActions]) -> None:
     """Verify meld action is available in engine-generated actions."""
     dm = event.decoded_meld
     if dm is None:
         return
     player = event.player
 
-    def _tiles_match(tiles_136, meld_tiles):
-        a = sorted(t // 4 for t in tiles_136)
-        b = sorted(t.index34 for t in meld_tiles)
-        return a == b
+    # Sorted index34 signature of the meld, computed once per call
+    dm_key = _tiles_key_136(dm.tiles_136)
 
     if dm.meld_type in (TenhouMeldType.CHI, TenhouMeldType.PON,
                         TenhouMeldType.DAIMINKAN):
@@ -323,20 +346,19 @@ def _verify_meld_available(rs: RoundState, event: Event, step_desc: str,
             raise ReplayVerificationError(
                 f"[{step_desc}] Meld without discard context"
             )
-        available = rs.get_response_actions(player, rs.last_discard,
-                                            rs.last_discard_player)
+        discard, discard_player = rs.last_discard, rs.last_discard_player
         if dm.meld_type == TenhouMeldType.CHI:
-            if not any(_tiles_match(dm.tiles_136, m.tiles) for m in available.can_chi):
+            if not rs.can_chi(player, discard, discard_player, dm_key):
                 raise ReplayVerificationError(
                     f"[{step_desc}] Illegal chi: meld not available"
                 )
         elif dm.meld_type == TenhouMeldType.PON:
-            if not any(_tiles_match(dm.tiles_136, m.tiles) for m in available.can_pon):
+            if not rs.can_pon(player, discard, discard_player, dm_key):
                 raise ReplayVerificationError(
                     f"[{step_desc}] Illegal pon: meld not available"
                 )
         elif dm.meld_type == TenhouMeldType.DAIMINKAN:
-            if not any(_tiles_match(dm.tiles_136, m.tiles) for m in available.can_daiminkan):
+            if not rs.can_daiminkan(player, discard, discard_player, dm_key):
                 raise ReplayVerificationError(
                     f"[{step_desc}] Illegal daiminkan: meld not available"
                 )
@@ -345,12 +367,13 @@ def _verify_meld_available(rs: RoundState, event: Event, step_desc: str,
     available = last_draw_available.get(player) or rs.get_draw_actions(player)
 
     if dm.meld_type == TenhouMeldType.ANKAN:
-        if not any(_tiles_match(dm.tiles_136, tiles) for tiles in available.can_ankan):
+        ankan_keys = frozenset(_tiles_key(tiles) for tiles in available.can_ankan)
+        if dm_key not in ankan_keys:
             raise ReplayVerificationError(
                 f"[{step_desc}] Illegal ankan: meld not available"
             )
     elif dm.meld_type == TenhouMeldType.KAKAN:
-        tile_34 = dm.tiles_136[0] // 4
+        tile_34 = dm.tiles_136[0] >> 2
         if not any(t.index34 == tile_34 for t in available.can_shouminkan):
             raise ReplayVerificationError(
                 f"[{step_desc}] Illegal kakan: meld not available"
@@ -362,44 +385,82 @@ def _verify_meld_available(rs: RoundState, event: Event, step_desc: str,
             )
 
 
+def _tiles_key_136(tiles_136: Sequence[int]) -> tuple:
+    """Sorted index34 signature of a list of 136-encoded tile ids."""
+    return tuple(sorted(t >> 2 for t in tiles_136))
+
+
+def _tiles_key(tiles: Sequence[Tile]) -> tuple:
+    """Sorted index34 signature of a sequence of Tile objects."""
+    return tuple(sorted(t.index34 for t in tiles))
+
+
 def _resolve_from_who(player: int, relative: int, num_players: int = 4) -> int:
     """Convert relative from_who to absolute seat index."""
     return (player + relative) % num_players
 
 
-def _process_chi(rs: RoundState, player: int, dm, step_desc: str):
-    """Process chi call."""
-    from_player = _resolve_from_who(player, dm.from_who_relative, rs.num_players)
-    called_tile = ALL_TILES_136[dm.called_tile_136]
+def _bucket_by_34(closed: Sequence[Tile]) -> Dict[int, List[Tile]]:
+    """Group closed tiles by index34, preserving hand order per bucket."""
+    bucket: Dict[int, List[Tile]] = {}
+    for t in closed:
+        bucket.setdefault(t.index34, []).append(t)
+    return bucket
 
-    # Build tiles for the meld
-    tiles = tuple(ALL_TILES_136[tid] for tid in dm.tiles_136)
 
-    # Find the actual tiles from the player's hand
-    hand = rs.players[player].hand
-    hand_tiles = []
-    for tid in dm.tiles_136:
-        t = ALL_TILES_136[tid]
-        if t == called_tile:
-            continue  # called tile comes from discard
-        # Find this specific tile in hand
-        found = None
-        for ht in hand.closed_tiles:
-            if ht.id == tid:
-                found = ht
-                break
-        if found is None:
-            # Try to find by index34 (tile with same type but different id)
-            for ht in hand.closed_tiles:
-                if ht.index34 == t.index34 and ht not in hand_tiles:
-                    found = ht
-                    break
+def _take_from_bucket(bucket: Dict[int, List[Tile]], tid: int) -> Optional[Tile]:
+    """Remove and return the tile with id ``tid``, else the first tile of
+    the same index34; None if the bucket has no such tile left."""
+    tiles = bucket.get(tid >> 2)
+    if not tiles:
+        return None
+    for i, t in enumerate(tiles):
+        if t.id == tid:
+            return tiles.pop(i)
+    # Tile with same type but different id
+    return tiles.pop(0)
+
+
+def _take_tiles_from_hand(bucket: Dict[int, List[Tile]], tids: Sequence[int],
+                          called_tid: int, label: str, player: int,
+                          step_desc: str) -> List[Tile]:
+    """Resolve a meld's tile ids to the matching tiles in the closed hand.
+
+    Skips the called tile (it comes from the discard). Each id is matched
+    exactly when possible, otherwise by index34 against a tile not yet
+    taken; taken tiles are consumed from the index34 bucket.
+    """
+    taken = []
+    for tid in tids:
+        if tid == called_tid:
+            continue
+        found = _take_from_bucket(bucket, tid)
         if found is None:
             raise ReplayVerificationError(
-                f"[{step_desc}] Chi: player {player} missing tile {tid} "
-                f"({t.name}) in hand"
+                f"[{step_desc}] {label}: player {player} missing tile {tid} "
+                f"({ALL_TILES_136[tid].name}) in hand"
             )
-        hand_tiles.append(found)
+        taken.append(found)
+    return taken
+
+
+def _finalize_call(rs: RoundState, player: int, meld_type: MeldType,
+                   action_type: ActionType, tiles: tuple, called: Tile,
+                   from_player: int) -> None:
+    """Build the Meld/Action for a call on a discard and apply it."""
+    meld = Meld(meld_type, tiles, called, from_player)
+    rs.process_call(Action(action_type, player, meld=meld))
+
+
+def _process_chi(rs: RoundState, player: int, dm: DecodedMeld,
+                 bucket: Dict[int, List[Tile]], step_desc: str) -> None:
+    """Process chi call."""
+    from_player = _resolve_from_who(player, dm.from_who_relative, rs.num_players)
+    called_tile = ALL_TILES_136[dm.called_tile_136]
+
+    # Find the actual tiles from the player's hand
+    hand_tiles = _take_tiles_from_hand(bucket, dm.tiles_136, dm.called_tile_136,
+                                       "Chi", player, step_desc)
 
     # Build the meld with actual tile objects
     meld_tiles = []
@@ -410,125 +471,64 @@ def _process_chi(rs: RoundState, player: int, dm, step_desc: str):
         else:
             meld_tiles.append(next(hand_tile_iter))
 
-    from mahjong.engine.action import Action, ActionType
-    meld = Meld(MeldType.CHI, tuple(meld_tiles), called_tile, from_player)
-    action = Action(ActionType.CHI, player, meld=meld)
-    rs.process_call(action)
+    _finalize_call(rs, player, MeldType.CHI, ActionType.CHI,
+                   tuple(meld_tiles), called_tile, from_player)
 
 
-def _process_pon(rs: RoundState, player: int, dm, step_desc: str):
+def _process_pon(rs: RoundState, player: int, dm: DecodedMeld,
+                 bucket: Dict[int, List[Tile]], step_desc: str) -> None:
     """Process pon call."""
     from_player = _resolve_from_who(player, dm.from_who_relative, rs.num_players)
     called_tile = ALL_TILES_136[dm.called_tile_136]
 
-    hand = rs.players[player].hand
-    hand_tiles = []
-    for tid in dm.tiles_136:
-        if tid == dm.called_tile_136:
-            continue
-        t = ALL_TILES_136[tid]
-        found = None
-        for ht in hand.closed_tiles:
-            if ht.id == tid and ht not in hand_tiles:
-                found = ht
-                break
-        if found is None:
-            for ht in hand.closed_tiles:
-                if ht.index34 == t.index34 and ht not in hand_tiles:
-                    found = ht
-                    break
-        if found is None:
-            raise ReplayVerificationError(
-                f"[{step_desc}] Pon: player {player} missing tile {tid} in hand"
-            )
-        hand_tiles.append(found)
+    hand_tiles = _take_tiles_from_hand(bucket, dm.tiles_136, dm.called_tile_136,
+                                       "Pon", player, step_desc)
 
     meld_tiles = tuple(hand_tiles) + (called_tile,)
-    from mahjong.engine.action import Action, ActionType
-    meld = Meld(MeldType.PON, meld_tiles, called_tile, from_player)
-    action = Action(ActionType.PON, player, meld=meld)
-    rs.process_call(action)
+    _finalize_call(rs, player, MeldType.PON, ActionType.PON,
+                   meld_tiles, called_tile, from_player)
 
 
-def _process_daiminkan(rs: RoundState, player: int, dm, step_desc: str):
+def _process_daiminkan(rs: RoundState, player: int, dm: DecodedMeld,
+                       bucket: Dict[int, List[Tile]], step_desc: str) -> None:
     """Process daiminkan (open kan from discard)."""
     from_player = _resolve_from_who(player, dm.from_who_relative, rs.num_players)
     called_tile = ALL_TILES_136[dm.called_tile_136]
 
-    hand = rs.players[player].hand
-    hand_tiles = []
-    for tid in dm.tiles_136:
-        if tid == dm.called_tile_136:
-            continue
-        t = ALL_TILES_136[tid]
-        found = None
-        for ht in hand.closed_tiles:
-            if ht.id == tid and ht not in hand_tiles:
-                found = ht
-                break
-        if found is None:
-            for ht in hand.closed_tiles:
-                if ht.index34 == t.index34 and ht not in hand_tiles:
-                    found = ht
-                    break
-        if found is None:
-            raise ReplayVerificationError(
-                f"[{step_desc}] Daiminkan: player {player} missing tile {tid}"
-            )
-        hand_tiles.append(found)
+    hand_tiles = _take_tiles_from_hand(bucket, dm.tiles_136, dm.called_tile_136,
+                                       "Daiminkan", player, step_desc)
 
     meld_tiles = tuple(hand_tiles) + (called_tile,)
-    from mahjong.engine.action import Action, ActionType
-    meld = Meld(MeldType.DAIMINKAN, meld_tiles, called_tile, from_player)
-    action = Action(ActionType.DAIMINKAN, player, meld=meld)
-    rs.process_call(action)
+    _finalize_call(rs, player, MeldType.DAIMINKAN, ActionType.DAIMINKAN,
+                   meld_tiles, called_tile, from_player)
 
     # Rinshan draw + new dora handled by next DRAW event
     # But daiminkan's reveal_new_dora is already called in process_call
 
 
-def _process_ankan(rs: RoundState, player: int, dm, step_desc: str):
+def _process_ankan(rs: RoundState, player: int, dm: DecodedMeld,
+                   bucket: Dict[int, List[Tile]], step_desc: str) -> None:
     """Process ankan (closed kan)."""
-    hand = rs.players[player].hand
-    tiles = []
-    for tid in dm.tiles_136:
-        t = ALL_TILES_136[tid]
-        found = None
-        for ht in hand.closed_tiles:
-            if ht.id == tid and ht not in tiles:
-                found = ht
-                break
-        if found is None:
-            for ht in hand.closed_tiles:
-                if ht.index34 == t.index34 and ht not in tiles:
-                    found = ht
-                    break
-        if found is None:
-            raise ReplayVerificationError(
-                f"[{step_desc}] Ankan: player {player} missing tile {tid}"
-            )
-        tiles.append(found)
+    tiles = _take_tiles_from_hand(bucket, dm.tiles_136, dm.called_tile_136,
+                                  "Ankan", player, step_desc)
 
     rs.process_ankan(player, tiles)
 
     # Rinshan draw handled by next DRAW event (wall_builder tags it)
 
 
-def _process_kakan(rs: RoundState, player: int, dm, step_desc: str):
+def _process_kakan(rs: RoundState, player: int, dm: DecodedMeld,
+                   bucket: Dict[int, List[Tile]], step_desc: str) -> None:
     """Process kakan (shouminkan / added kan)."""
     # Find the added tile: it's the one at the 'unused' position
     # We need to find which tile is being added to an existing pon
-    hand = rs.players[player].hand
 
     # The tile_34 of the kan
     tile_34 = dm.tiles_136[0] // 4
 
-    # Find the tile in hand that matches
-    added_tile = None
-    for ht in hand.closed_tiles:
-        if ht.index34 == tile_34:
-            added_tile = ht
-            break
+    # First tile in hand that matches
+    matches = bucket.get(tile_34)
+    added_tile = matches[0] if matches else None
 
     if added_tile is None:
         raise ReplayVerificationError(
@@ -539,24 +539,17 @@ def _process_kakan(rs: RoundState, player: int, dm, step_desc: str):
     rs.process_shouminkan(player, added_tile)
 
 
-def _process_kita(rs: RoundState, player: int, dm, step_desc: str):
+def _process_kita(rs: RoundState, player: int, dm: DecodedMeld,
+                  bucket: Dict[int, List[Tile]], step_desc: str) -> None:
     """Process kita (sanma north declaration)."""
     tile_id = dm.tiles_136[0]
-    tile = ALL_TILES_136[tile_id]
-
-    hand = rs.players[player].hand
-    # Find the specific north tile in hand
-    found = None
-    for ht in hand.closed_tiles:
-        if ht.id == tile_id:
-            found = ht
-            break
-    if found is None:
-        # Try by index34
-        for ht in hand.closed_tiles:
-            if ht.index34 == 30:
-                found = ht
-                break
+
+    players = rs.players
+    p = players[player]
+    hand = p.hand
+    # Find the specific north tile in hand, falling back to any north
+    # tile (same index34).
+    found = _take_from_bucket(bucket, tile_id)
     if found is None:
         raise ReplayVerificationError(
             f"[{step_desc}] Kita: player {player} missing north tile in hand"
@@ -565,15 +558,15 @@ def _process_kita(rs: RoundState, player: int, dm, step_desc: str):
     # Remove north from hand and add to kita_tiles
     hand.closed_tiles.remove(found)
     hand.draw_tile = None
-    rs.players[player].kita_tiles.append(found)
+    p.kita_tiles.append(found)
 
     # Cancel all ippatsu (kita is a call in sanma)
-    for p in rs.players:
-        p.hand.is_ippatsu = False
+    for other in players:
+        other.hand.is_ippatsu = False
 
 
 def _verify_agari(rs: RoundState, rd: RoundData, event: Event, step_desc: str,
-                  is_secondary_ron: bool = False):
+                  is_secondary_ron: bool = False) -> None:
     """Verify AGARI (win) result."""
     winner = event.agari_who
     from_who = event.agari_from
@@ -584,10 +577,16 @@ def _verify_agari(rs: RoundState, rd: RoundData, event: Event, step_desc: str,
     if is_secondary_ron and not is_tsumo:
         agari_honba = 0
 
-    player = rs.players[winner]
+    players = rs.players
+    num_players = rs.num_players
+    is_sanma = rs.is_sanma
+    player = players[winner]
     hand = player.hand
+    wall = rs.wall
+    dora_tiles_34 = wall.get_dora_tiles_34()
+    uradora_tiles_34 = wall.get_uradora_tiles_34()
 
-    kita_count = len(rs.players[winner].kita_tiles) if rs.is_sanma else 0
+    kita_count = len(player.kita_tiles) if is_sanma else 0
 
     if is_tsumo:
         # Tsumo: win_tile is the drawn tile
@@ -598,8 +597,8 @@ def _verify_agari(rs: RoundState, rd: RoundData, event: Event, step_desc: str,
             seat_wind_34=player.seat_wind.index34,
             round_wind_34=rs.round_wind.index34,
             is_dealer=player.is_dealer,
-            dora_tiles_34=rs.wall.get_dora_tiles_34(),
-            uradora_tiles_34=rs.wall.get_uradora_tiles_34(),
+            dora_tiles_34=dora_tiles_34,
+            uradora_tiles_34=uradora_tiles_34,
             honba=agari_honba,
             is_riichi=hand.is_riichi,
             is_double_riichi=hand.is_double_riichi,
@@ -608,31 +607,34 @@ def _verify_agari(rs: RoundState, rd: RoundData, event: Event, step_desc: str,
             is_rinshan=rs.is_rinshan,
             is_tenhou=(player.is_dealer and rs.turn_count == 0),
             is_chiihou=(not player.is_dealer and rs.first_draw[winner]),
-            is_sanma=rs.is_sanma,
+            is_sanma=is_sanma,
             kita_count=kita_count,
         )
     else:
-        # Ron: need to temporarily add win tile
-        test_hand = hand.clone()
-        test_hand.closed_tiles.append(win_tile)
-        is_last_tile = rs.wall.remaining == 0
-        result = calculate_score(
-            hand=test_hand,
-            win_tile=win_tile,
-            is_tsumo=False,
-            seat_wind_34=player.seat_wind.index34,
-            round_wind_34=rs.round_wind.index34,
-            is_dealer=player.is_dealer,
-            dora_tiles_34=rs.wall.get_dora_tiles_34(),
-            uradora_tiles_34=rs.wall.get_uradora_tiles_34(),
-            honba=agari_honba,
-            is_riichi=hand.is_riichi,
-            is_double_riichi=hand.is_double_riichi,
-            is_ippatsu=hand.is_ippatsu,
-            is_houtei=is_last_tile,
-            is_sanma=rs.is_sanma,
-            kita_count=kita_count,
-        )
+        # Ron: temporarily add the win tile (calculate_score only reads
+        # the hand, so append/pop avoids cloning it)
+        is_last_tile = wall.remaining == 0
+        hand.closed_tiles.append(win_tile)
+        try:
+            result = calculate_score(
+                hand=hand,
+                win_tile=win_tile,
+                is_tsumo=False,
+                seat_wind_34=player.seat_wind.index34,
+                round_wind_34=rs.round_wind.index34,
+                is_dealer=player.is_dealer,
+                dora_tiles_34=dora_tiles_34,
+                uradora_tiles_34=uradora_tiles_34,
+                honba=agari_honba,
+                is_riichi=hand.is_riichi,
+                is_double_riichi=hand.is_double_riichi,
+                is_ippatsu=hand.is_ippatsu,
+                is_houtei=is_last_tile,
+                is_sanma=is_sanma,
+                kita_count=kita_count,
+            )
+        finally:
+            hand.closed_tiles.pop()
 
     if result is None:
         raise ReplayVerificationError(
@@ -645,34 +647,27 @@ def _verify_agari(rs: RoundState, rd: RoundData, event: Event, step_desc: str,
     expected_ten = event.agari_ten  # [fu, points, ...]
     # Subtract honba bonus from engine result for comparison
     if is_tsumo:
-        num_payers = rs.num_players - 1
+        num_payers = num_players - 1
         honba_bonus = num_payers * 100 * agari_honba
     else:
-        honba_bonus = (200 if rs.is_sanma else 300) * agari_honba
+        honba_bonus = (200 if is_sanma else 300) * agari_honba
     engine_points_no_honba = result.total_points - honba_bonus
     verify_agari_score(expected_ten, result.fu, engine_points_no_honba, step_desc)
 
     # Verify score changes
     if event.agari_sc:
         # Build engine score changes (always 4 entries, P3=0 for sanma)
-        engine_changes = [0, 0, 0, 0]
         if is_tsumo:
-            if player.is_dealer:
-                for i in range(rs.num_players):
-                    if i != winner:
-                        engine_changes[i] = -result.non_dealer_payment
-                        engine_changes[winner] += result.non_dealer_payment
-            else:
-                for i in range(rs.num_players):
-                    if i == winner:
-                        continue
-                    if rs.players[i].is_dealer:
-                        engine_changes[i] = -result.dealer_payment
-                        engine_changes[winner] += result.dealer_payment
-                    else:
-                        engine_changes[i] = -result.non_dealer_payment
-                        engine_changes[winner] += result.non_dealer_payment
+            # Per-seat payment vector: every other seat pays the non-dealer
+            # share, except the dealer when a non-dealer wins.
+            pay = [result.non_dealer_payment] * num_players
+            if not player.is_dealer:
+                pay[rd.dealer] = result.dealer_payment
+            pay[winner] = 0
+            engine_changes = [-x for x in pay] + [0] * (4 - num_players)
+            engine_changes[winner] = sum(pay)
         else:
+            engine_changes = [0, 0, 0, 0]
             engine_changes[winner] = result.ron_payment
             engine_changes[from_who] = -result.ron_payment
 
@@ -688,7 +683,7 @@ def _verify_agari(rs: RoundState, rd: RoundData, event: Event, step_desc: str,
 
 
 def _verify_ryuukyoku(rs: RoundState, rd: RoundData, event: Event,
-                      step_desc: str):
+                      step_desc: str) -> None:
     """Verify RYUUKYOKU (draw) result."""
     if event.ryuukyoku_sc:
         # For exhaustive draw, verify tenpai payments
@@ -12,11 +12,10 @@ XML tag mapping:
   INIT = round init
 """
 
-import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import Iterator, List, NamedTuple, Optional, Union
 
 from .decoder import decode_meld, DecodedMeld
 
@@ -31,7 +30,7 @@ class EventType(Enum):
     RYUUKYOKU = "ryuukyoku"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     event_type: EventType
     player: int
@@ -53,7 +52,17 @@ class Event:
     ryuukyoku_hai: Optional[List[Optional[List[int]]]] = None  # tenpai hands
 
 
-@dataclass
+class DrawDiscardEvent(NamedTuple):
+    """Lightweight event for draw/discard tags, which dominate every log.
+
+    Exposes the same event_type/player/tile_id attributes as Event.
+    """
+    event_type: EventType
+    player: int
+    tile_id: int
+
+
+@dataclass(slots=True)
 class RoundData:
     round_number: int       # 0=E1, 1=E2, ..., 4=S1, ...
     honba: int
@@ -64,40 +73,37 @@ class RoundData:
     hands: List[List[int]]  # 3 or 4 players' initial hands (tile_ids)
     is_sanma: bool = False  # True for 3-player games
     num_players: int = 4
-    events: List[Event] = field(default_factory=list)
+    events: List[Union[Event, DrawDiscardEvent]] = field(default_factory=list)
 
 
-# Draw/discard tag patterns
-_DRAW_TAGS = {
-    'T': 0, 'U': 1, 'V': 2, 'W': 3,
-}
-_DISCARD_TAGS = {
-    'D': 0, 'E': 1, 'F': 2, 'G': 3,
+# Draw/discard tags like T72, D113, U118: first letter -> (seat, event type)
+_TILE_TAGS = {
+    'T': (0, EventType.DRAW), 'U': (1, EventType.DRAW),
+    'V': (2, EventType.DRAW), 'W': (3, EventType.DRAW),
+    'D': (0, EventType.DISCARD), 'E': (1, EventType.DISCARD),
+    'F': (2, EventType.DISCARD), 'G': (3, EventType.DISCARD),
 }
 
-# Regex to match draw/discard tags like T72, D113, U118, E118, etc.
-_TILE_TAG_RE = re.compile(r'^([TUVWDEFG])(\d+)$')
-
 
 def parse(xml_path: str) -> List[RoundData]:
     """Parse a Tenhou mjlog XML file into a list of RoundData."""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
-    # Detect sanma from GO element
+    # GO precedes the first INIT, so sanma is known before any round starts
     is_sanma = False
-    for elem in root:
-        if elem.tag == 'GO':
-            go_type = int(elem.attrib.get('type', '0'))
-            is_sanma = bool(go_type & 0x10)
-            break
+    go_seen = False
 
     rounds: List[RoundData] = []
     current_round: Optional[RoundData] = None
 
-    for elem in root:
+    for elem in _iter_elements(xml_path):
         tag = elem.tag
 
+        if tag == 'GO':
+            if not go_seen:
+                go_type = int(elem.attrib.get('type', '0'))
+                is_sanma = bool(go_type & 0x10)
+                go_seen = True
+            continue
+
         if tag == 'INIT':
             current_round = _parse_init(elem, is_sanma)
             rounds.append(current_round)
@@ -107,22 +113,11 @@ def parse(xml_path: str) -> List[RoundData]:
             continue
 
         # Try draw/discard tags
-        m = _TILE_TAG_RE.match(tag)
-        if m:
-            letter = m.group(1)
-            tile_id = int(m.group(2))
-            if letter in _DRAW_TAGS:
-                current_round.events.append(Event(
-                    event_type=EventType.DRAW,
-                    player=_DRAW_TAGS[letter],
-                    tile_id=tile_id,
-                ))
-            elif letter in _DISCARD_TAGS:
-                current_round.events.append(Event(
-                    event_type=EventType.DISCARD,
-                    player=_DISCARD_TAGS[letter],
-                    tile_id=tile_id,
-                ))
+        info = _TILE_TAGS.get(tag[0])
+        if info is not None and tag[1:].isdigit():
+            seat, etype = info
+            current_round.events.append(
+                DrawDiscardEvent(etype, seat, int(tag[1:])))
             continue
 
         if tag == 'N':
@@ -164,27 +159,42 @@ def parse(xml_path: str) -> List[RoundData]:
     return rounds
 
 
+def _iter_elements(xml_path: str) -> Iterator[ET.Element]:
+    """Stream the top-level elements of an mjlog file.
+
+    Each element is cleared and detached from the root once the caller
+    moves on, so memory stays bounded regardless of log length.
+    """
+    context = ET.iterparse(xml_path, events=('start', 'end'))
+    _, root = next(context)
+    for event, elem in context:
+        if event == 'end' and elem is not root:
+            yield elem
+            elem.clear()
+            root.clear()
+
+
+def _int_csv(value: str) -> List[int]:
+    """Parse a comma-separated attribute into ints; blank values give []."""
+    if not value or value.isspace():
+        return []
+    return list(map(int, value.split(',')))
+
+
 def _parse_init(elem: ET.Element, is_sanma: bool = False) -> RoundData:
     """Parse INIT element into RoundData."""
-    seed = [int(x) for x in elem.attrib['seed'].split(',')]
+    seed = _int_csv(elem.attrib['seed'])
     # seed: [round_number, honba, riichi_sticks, dice1, dice2, dora_indicator]
     round_number = seed[0]
     honba = seed[1]
     riichi_sticks = seed[2]
     dora_indicator = seed[5]
 
-    scores = [int(x) * 100 for x in elem.attrib['ten'].split(',')]
+    scores = [x * 100 for x in _int_csv(elem.attrib['ten'])]
     dealer = int(elem.attrib['oya'])
 
     num_players = 3 if is_sanma else 4
-    hands = []
-    for i in range(4):
-        key = f'hai{i}'
-        if key in elem.attrib and elem.attrib[key].strip():
-            hand = [int(x) for x in elem.attrib[key].split(',')]
-        else:
-            hand = []
-        hands.append(hand)
+    hands = [_int_csv(elem.attrib.get(f'hai{i}', '')) for i in range(4)]
 
     return RoundData(
         round_number=round_number,
@@ -204,27 +214,27 @@ def _parse_agari(elem: ET.Element) -> Event:
     who = int(elem.attrib['who'])
     from_who = int(elem.attrib['fromWho'])
     machi = int(elem.attrib['machi'])
-    ten = [int(x) for x in elem.attrib['ten'].split(',')]
+    ten = _int_csv(elem.attrib['ten'])
 
     yaku = []
     if 'yaku' in elem.attrib:
-        yaku = [int(x) for x in elem.attrib['yaku'].split(',')]
+        yaku = _int_csv(elem.attrib['yaku'])
     elif 'yakuman' in elem.attrib:
-        yaku = [int(x) for x in elem.attrib['yakuman'].split(',')]
+        yaku = _int_csv(elem.attrib['yakuman'])
 
-    sc = [int(x) for x in elem.attrib['sc'].split(',')]
+    sc = _int_csv(elem.attrib['sc'])
 
     dora = []
     if 'doraHai' in elem.attrib:
-        dora = [int(x) for x in elem.attrib['doraHai'].split(',')]
+        dora = _int_csv(elem.attrib['doraHai'])
 
     uradora = []
     if 'doraHaiUra' in elem.attrib:
-        uradora = [int(x) for x in elem.attrib['doraHaiUra'].split(',')]
+        uradora = _int_csv(elem.attrib['doraHaiUra'])
 
     ba = [0, 0]
     if 'ba' in elem.attrib:
-        ba = [int(x) for x in elem.attrib['ba'].split(',')]
+        ba = _int_csv(elem.attrib['ba'])
 
     return Event(
         event_type=EventType.AGARI,
@@ -247,14 +257,14 @@ def _parse_ryuukyoku(elem: ET.Element) -> Event:
 
     sc = None
     if 'sc' in elem.attrib:
-        sc = [int(x) for x in elem.attrib['sc'].split(',')]
+        sc = _int_csv(elem.attrib['sc'])
 
     # Tenpai hands (hai0..hai3) - present if player is tenpai
     hai: List[Optional[List[int]]] = [None, None, None, None]
     for i in range(4):
         key = f'hai{i}'
         if key in elem.attrib:
-            hai[i] = [int(x) for x in elem.attrib[key].split(',')]
+            hai[i] = _int_csv(elem.attrib[key])
 
     return Event(
         event_type=EventType.RYUUKYOKU,
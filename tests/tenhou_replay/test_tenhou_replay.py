@@ -1,10 +1,14 @@
 """Pytest entry point for Tenhou replay tests.
 
-Parametrizes over all XML files in tests/xml/2024/ and replays
+Parametrizes over all XML files in tests/xml/failed/ and replays
 each round, verifying engine consistency with Tenhou's results.
+
+Each XML file is an independent test: parse() builds fresh RoundData on
+every call and replay_round() keeps no shared mutable state (ALL_TILES_136
+is only read), so the suite can be distributed with pytest-xdist
+(``pytest -n auto``).
 """
 
-import glob
 import os
 
 import pytest
@@ -12,7 +16,25 @@ import pytest
 from . import driver, parser
 
 XML_DIR = os.path.join(os.path.dirname(__file__), "..", "xml", "failed")
-XML_FILES = sorted(glob.glob(os.path.join(XML_DIR, "*.xml")))
+
+
+def _collect_xml_files(xml_dir):
+    """Sorted XML paths in xml_dir (empty if the directory is missing).
+
+    Runs once per process at import; parametrize needs the list at
+    collection time, so it cannot come from a session-scoped fixture.
+    """
+    try:
+        with os.scandir(xml_dir) as it:
+            paths = [e.path for e in it
+                     if e.name.endswith(".xml") and not e.name.startswith(".")
+                     and e.is_file()]
+    except FileNotFoundError:
+        return []
+    return sorted(paths)
+
+
+XML_FILES = _collect_xml_files(XML_DIR)
 
 
 @pytest.mark.parametrize(
@@ -8,6 +8,7 @@ the wall from the information available in the XML:
   - Rinshan draws after kan (dead wall positions 10-13)
 """
 
+from operator import itemgetter
 from typing import List, Tuple
 
 from mahjong.core.tile import Tile, ALL_TILES_136
@@ -15,6 +16,16 @@ from mahjong.core.tile import Tile, ALL_TILES_136
 from .parser import RoundData, EventType
 from .decoder import TenhouMeldType
 
+# Kan melds whose replacement tile comes from the dead wall. Kita is left
+# out: its replacement is drawn from the live wall, so it stays a live draw.
+_KAN_KINDS = frozenset({
+    TenhouMeldType.ANKAN, TenhouMeldType.DAIMINKAN, TenhouMeldType.KAKAN,
+})
+
+# Tile-id universes as bitmasks (bit i = tile id i); sanma drops 2m-8m (4-31)
+_ALL_MASK_4P = (1 << 136) - 1
+_ALL_MASK_SANMA = _ALL_MASK_4P & ~((1 << 32) - (1 << 4))
+
 
 def build_wall(rd: RoundData) -> Tuple[List[Tile], List[Tile], int]:
     """Build live_wall and dead_wall tile lists from round data.
@@ -27,41 +38,44 @@ def build_wall(rd: RoundData) -> Tuple[List[Tile], List[Tile], int]:
              rinshan3, rinshan2, rinshan1, rinshan0]
           (rinshan drawn in reverse: index 13 first, then 12, 11, 10)
     """
-    # Collect all draw tile_ids in order from events
-    live_draw_ids: List[int] = []
+    # Collect all draw tile_ids in order from events, plus the dora
+    # indicators and uradora from AGARI events, in a single pass.
+    # Use the most complete dora set across winners (double ron can differ).
+    # Live draws are preallocated to the event count (an upper bound) and
+    # filled by index; rinshan draws are at most a handful, so they append.
+    events = rd.events
+    live_draw_ids: List[int] = [0] * len(events)
+    live_n = 0
     rinshan_ids: List[int] = []
+    dora_ids: List[int] = []
+    uradora_ids: List[int] = []
 
-    # Track kan/kita events to identify rinshan draws
+    # Track kan events to identify rinshan draws
     expect_rinshan = False
 
-    for event in rd.events:
-        if event.event_type == EventType.MELD and event.decoded_meld is not None:
-            mt = event.decoded_meld.meld_type
-            if mt in (TenhouMeldType.ANKAN, TenhouMeldType.DAIMINKAN,
-                      TenhouMeldType.KAKAN):
+    DRAW = EventType.DRAW
+    MELD = EventType.MELD
+    AGARI = EventType.AGARI
+    for event in events:
+        et = event.event_type
+        if et is MELD and event.decoded_meld is not None:
+            if event.decoded_meld.meld_type in _KAN_KINDS:
                 expect_rinshan = True
-        elif event.event_type == EventType.AGARI:
+        elif et is AGARI:
             # Chankan can occur before the rinshan draw; clear expectation.
-            if expect_rinshan:
-                expect_rinshan = False
-        elif event.event_type == EventType.DRAW:
+            expect_rinshan = False
+            if event.agari_dora and len(event.agari_dora) > len(dora_ids):
+                dora_ids = list(event.agari_dora)
+            if event.agari_uradora and len(event.agari_uradora) > len(uradora_ids):
+                uradora_ids = list(event.agari_uradora)
+        elif et is DRAW:
             if expect_rinshan:
                 rinshan_ids.append(event.tile_id)
                 expect_rinshan = False
             else:
-                live_draw_ids.append(event.tile_id)
-
-    # Collect dora indicators and uradora from AGARI events
-    # Use the most complete set across winners (double ron can differ).
-    dora_ids: List[int] = []
-    uradora_ids: List[int] = []
-    for event in rd.events:
-        if event.event_type != EventType.AGARI:
-            continue
-        if event.agari_dora and len(event.agari_dora) > len(dora_ids):
-            dora_ids = list(event.agari_dora)
-        if event.agari_uradora and len(event.agari_uradora) > len(uradora_ids):
-            uradora_ids = list(event.agari_uradora)
+                live_draw_ids[live_n] = event.tile_id
+                live_n += 1
+    del live_draw_ids[live_n:]
 
     # If no AGARI, use the initial dora indicator
     if not dora_ids:
@@ -76,20 +90,14 @@ def build_wall(rd: RoundData) -> Tuple[List[Tile], List[Tile], int]:
     # Positions 10,11,12,13 = rinshan tiles (drawn from 13 backwards)
 
     # All tiles accounted for
-    used_tile_ids = set()
-    for hand in rd.hands:
-        used_tile_ids.update(hand)
-    used_tile_ids.update(live_draw_ids)
-    used_tile_ids.update(rinshan_ids)
-    used_tile_ids.update(dora_ids)
-    used_tile_ids.update(uradora_ids)
+    used_mask = 0
+    for ids in (*rd.hands, live_draw_ids, rinshan_ids, dora_ids, uradora_ids):
+        for tid in ids:
+            used_mask |= 1 << tid
 
     # For sanma, exclude 2m-8m tiles (tile_ids 4-31)
-    if rd.is_sanma:
-        all_tile_ids = set(i for i in range(136) if not (4 <= i < 32))
-    else:
-        all_tile_ids = set(range(136))
-    unknown_ids = sorted(all_tile_ids - used_tile_ids)
+    all_mask = _ALL_MASK_SANMA if rd.is_sanma else _ALL_MASK_4P
+    unknown_mask = all_mask & ~used_mask
 
     # Build dead wall array (14 slots)
     dead_wall = [None] * 14
@@ -111,8 +119,15 @@ def build_wall(rd: RoundData) -> Tuple[List[Tile], List[Tile], int]:
 
     # Fill remaining dead wall slots with unknown tiles
     # Separate unknowns: first fill dead wall, then append rest to live wall
-    dead_wall_used = set(x for x in dead_wall if x is not None)
-    remaining_unknown = [x for x in unknown_ids if x not in dead_wall_used]
+    for x in dead_wall:
+        if x is not None:
+            unknown_mask &= ~(1 << x)
+    # Lowest-set-bit enumeration yields the ids already in ascending order
+    remaining_unknown = []
+    while unknown_mask:
+        low = unknown_mask & -unknown_mask
+        remaining_unknown.append(low.bit_length() - 1)
+        unknown_mask ^= low
 
     unknown_iter = iter(remaining_unknown)
     for i in range(14):
@@ -123,7 +138,12 @@ def build_wall(rd: RoundData) -> Tuple[List[Tile], List[Tile], int]:
     undrawn_ids = list(unknown_iter)  # consume the rest
     live_all_ids = live_draw_ids + undrawn_ids
 
-    live_wall_tiles = [ALL_TILES_136[tid] for tid in live_all_ids]
-    dead_wall_tiles = [ALL_TILES_136[tid] for tid in dead_wall]
+    # itemgetter with several ids returns a tuple in one C-level call;
+    # with a single id it returns the bare tile, and it needs at least one.
+    if len(live_all_ids) > 1:
+        live_wall_tiles = list(itemgetter(*live_all_ids)(ALL_TILES_136))
+    else:
+        live_wall_tiles = [ALL_TILES_136[tid] for tid in live_all_ids]
+    dead_wall_tiles = list(itemgetter(*dead_wall)(ALL_TILES_136))
 
     return live_wall_tiles, dead_wall_tiles, dora_revealed
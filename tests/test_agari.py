@@ -1,5 +1,6 @@
 """Tests for agari.py - win detection"""
 
+import functools
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -9,42 +10,42 @@ from mahjong.rules.agari import (
 )
 
 
-def make_34(tiles_str):
-    """Helper: create 34 array from string like '1112345678999m'."""
+# make_34 character table: digits are buffered, suit letters flush the
+# buffered digits at the suit's offset, honor letters
+# (E=東,S=南,W=西,N=北,H=白,G=發,R=中) count directly.
+_DIGIT, _SUIT, _HONOR = 0, 1, 2
+_CHAR_ACTION = {str(d): (_DIGIT, d) for d in range(10)}
+_CHAR_ACTION.update({'m': (_SUIT, 0), 'p': (_SUIT, 9), 's': (_SUIT, 18)})
+_CHAR_ACTION.update({ch: (_HONOR, 27 + i) for i, ch in enumerate('ESWNHGR')})
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_34(tiles_str):
+    """Parse a tile string into an immutable 34-count tuple (memoized)."""
     arr = [0] * 34
     numbers = []
     for ch in tiles_str:
-        if ch.isdigit():
-            numbers.append(int(ch))
-        elif ch == 'm':
-            for n in numbers:
-                arr[n - 1] += 1
-            numbers = []
-        elif ch == 'p':
-            for n in numbers:
-                arr[9 + n - 1] += 1
-            numbers = []
-        elif ch == 's':
+        action = _CHAR_ACTION.get(ch)
+        if action is None:
+            continue
+        kind, value = action
+        if kind == _DIGIT:
+            numbers.append(value)
+        elif kind == _SUIT:
             for n in numbers:
-                arr[18 + n - 1] += 1
-            numbers = []
-    # Handle honor tiles: E=東,S=南,W=西,N=北,H=白,G=發,R=中
-    for ch in tiles_str:
-        if ch == 'E':
-            arr[27] += 1
-        elif ch == 'S':
-            arr[28] += 1
-        elif ch == 'W':
-            arr[29] += 1
-        elif ch == 'N':
-            arr[30] += 1
-        elif ch == 'H':
-            arr[31] += 1
-        elif ch == 'G':
-            arr[32] += 1
-        elif ch == 'R':
-            arr[33] += 1
-    return arr
+                arr[value + n - 1] += 1
+            numbers.clear()
+        else:
+            arr[value] += 1
+    return tuple(arr)
+
+
+def make_34(tiles_str):
+    """Helper: create 34 array from string like '1112345678999m'.
+
+    Returns a fresh list each call, since tests mutate the result.
+    """
+    return list(_parse_34(tiles_str))
 
 
 class TestStandardAgari:
@@ -11,14 +11,18 @@ from mahjong.core.hand import Hand
 from mahjong.core.tile import ALL_TILES_136, make_tiles_from_string
 
 
+def make_hand(tiles_str):
+    """Helper: Hand whose closed tiles are parsed from shorthand."""
+    hand = Hand()
+    hand.add_closed_tiles(make_tiles_from_string(tiles_str))
+    return hand
+
+
 class TestDiscardFuriten:
     def test_furiten_discard_in_pool(self):
         """If a waiting tile is in discard pool, it's furiten."""
-        hand = Hand()
         # Tenpai: 123m 456p 789s 東 - waiting on 東
-        tiles = make_tiles_from_string("123m456p789s東")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand = make_hand("123m456p789s東")
         # Discard 東 earlier
         east = make_tiles_from_string("東")[0]
         hand.discard_pool.append(east)
@@ -29,10 +33,7 @@ class TestDiscardFuriten:
 
     def test_not_furiten(self):
         """If no waiting tiles in discard pool, not furiten."""
-        hand = Hand()
-        tiles = make_tiles_from_string("123m456p789s東")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand = make_hand("123m456p789s東")
         # Discard something else
         west = make_tiles_from_string("西")[0]
         hand.discard_pool.append(west)
@@ -68,9 +69,6 @@ class TestRiichiFuriten:
 
 class TestGetWaitingTiles:
     def test_tenpai_hand(self):
-        hand = Hand()
-        tiles = make_tiles_from_string("123m456p789s東")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand = make_hand("123m456p789s東")
         waits = get_hand_waiting_tiles(hand)
         assert 27 in waits  # Waiting on 東
@@ -11,6 +11,13 @@ from mahjong.player.base import GameView, OpponentView
 from mahjong.player.greedy_ai import GreedyAI
 
 
+def make_hand(tiles_str):
+    """Helper: Hand whose closed tiles are parsed from shorthand."""
+    hand = Hand()
+    hand.add_closed_tiles(make_tiles_from_string(tiles_str))
+    return hand
+
+
 def make_game_view(hand, seat=0, wind=Wind.EAST, score=25000,
                    opponents=None) -> GameView:
     return GameView(
@@ -29,10 +36,7 @@ class TestGreedyAIDiscard:
     def test_discard_reduces_shanten(self):
         """AI should choose discard that minimizes shanten."""
         ai = GreedyAI("test")
-        hand = Hand()
-        tiles = make_tiles_from_string("123m456p789s東東")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand = make_hand("123m456p789s東東")
         # Add an isolated honor tile
         north = make_tiles_from_string("北")[0]
         hand.draw(north)
@@ -45,10 +49,7 @@ class TestGreedyAIDiscard:
     def test_always_tsumo(self):
         """AI should always tsumo when available."""
         ai = GreedyAI("test")
-        hand = Hand()
-        tiles = make_tiles_from_string("123m456p789s東東東南")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand = make_hand("123m456p789s東東東南")
 
         gv = make_game_view(hand)
         available = AvailableActions(player=0)
@@ -75,11 +76,8 @@ class TestGreedyAIDefense:
     def test_defense_mode(self):
         """AI should enter defense when opponent is riichi and own shanten >= 2."""
         ai = GreedyAI("test")
-        hand = Hand()
         # Bad hand with high shanten
-        tiles = make_tiles_from_string("159m159p159s東南西北")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand = make_hand("159m159p159s東南西北")
 
         opp = OpponentView(
             seat=1, name="opp", score=25000, seat_wind=Wind.SOUTH,
@@ -26,6 +26,12 @@ class TestHand:
         assert len(hand.discard_pool) == 1
         assert hand.discard_pool[0] == t1
 
+    def test_add_closed_tiles(self):
+        hand = Hand()
+        hand.add_closed_tiles(ALL_TILES_136[i] for i in (0, 4, 8))
+        assert [t.id for t in hand.closed_tiles] == [0, 4, 8]
+        assert hand.draw_tile is None
+
     def test_sort(self):
         hand = Hand()
         hand.draw(ALL_TILES_136[36])  # 1p
@@ -4,6 +4,7 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from mahjong.core.wall import Wall
+from mahjong.core.tile import make_tiles_from_string
 from mahjong.core.player_state import PlayerState, Wind
 from mahjong.engine.action import Action, ActionType, AvailableActions
 from mahjong.engine.event import EventBus
@@ -100,3 +101,49 @@ class TestDealTiles:
 
         for p in players:
             assert len(p.hand.closed_tiles) == 13
+
+
+class TestCallPredicates:
+    def _make_state(self, closed, is_sanma=False):
+        n = 3 if is_sanma else 4
+        players = [PlayerState(i, f"P{i}") for i in range(n)]
+        rs = RoundState(
+            players=players, wall=Wall(is_sanma=is_sanma), round_wind=Wind.EAST,
+            honba=0, riichi_sticks=0, event_bus=EventBus(), is_sanma=is_sanma,
+        )
+        players[1].hand.closed_tiles = make_tiles_from_string(closed)
+        return rs
+
+    def test_chi_matches_response_actions(self):
+        rs = self._make_state("2356m")
+        discard = make_tiles_from_string("4m")[0]
+        available = rs.get_response_actions(1, discard, 0)
+        expected = {tuple(sorted(t.index34 for t in m.tiles)) for m in available.can_chi}
+        assert expected == {(1, 2, 3), (2, 3, 4), (3, 4, 5)}
+        for start in range(0, 4):
+            seq = [start, start + 1, start + 2]
+            assert rs.can_chi(1, discard, 0, seq) == (tuple(seq) in expected)
+
+    def test_chi_only_from_left(self):
+        rs = self._make_state("23m")
+        discard = make_tiles_from_string("4m")[0]
+        assert rs.can_chi(1, discard, 0, [1, 2, 3])
+        assert not rs.can_chi(1, discard, 2, [1, 2, 3])
+
+    def test_chi_not_across_suits(self):
+        rs = self._make_state("89m1p")
+        discard = make_tiles_from_string("1p")[0]
+        assert not rs.can_chi(1, discard, 0, [7, 8, 9])
+
+    def test_pon_and_daiminkan(self):
+        rs = self._make_state("555m")
+        discard = make_tiles_from_string("5m")[0]
+        assert rs.can_pon(1, discard, 0, [4, 4, 4])
+        assert rs.can_daiminkan(1, discard, 0, [4, 4, 4, 4])
+        assert not rs.can_pon(1, discard, 0, [4, 4, 5])
+
+    def test_no_calls_after_riichi(self):
+        rs = self._make_state("555m")
+        rs.players[1].hand.is_riichi = True
+        discard = make_tiles_from_string("5m")[0]
+        assert not rs.can_pon(1, discard, 0, [4, 4, 4])
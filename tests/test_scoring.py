@@ -57,8 +57,7 @@ class TestScoreCalculation:
         # 123m 456p 789s 東東東 南 (13 tiles) + draw 南 = 14 tiles
         # Final hand: 123m 456p 789s 東東東 南南
         tiles = make_tiles_from_string("123m456p789s東東東")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand.add_closed_tiles(tiles)
         # Add first 南 to closed tiles
         first_nan = ALL_TILES_136[28 * 4]  # 南 id=112
         hand.closed_tiles.append(first_nan)
@@ -86,8 +85,7 @@ class TestScoreCalculation:
         # Open hand with no yakuhai
         from mahjong.core.meld import Meld, MeldType
         tiles = make_tiles_from_string("234m567p89s")
-        for t in tiles:
-            hand.closed_tiles.append(t)
+        hand.add_closed_tiles(tiles)
         pon = Meld(MeldType.PON,
                    tuple(make_tiles_from_string("555s")),
                    make_tiles_from_string("5s")[0], 1)
@@ -108,3 +106,42 @@ class TestScoreCalculation:
         # Open hand with no yaku -> None
         # (Actually 567s straight might give tanyao if all middle tiles)
         # This depends on exact tiles, result may or may not be None
+
+    def test_repeat_scoring_tracks_red_fives(self):
+        """Identical hands score identically; a red five adds a han."""
+        def score(five_id):
+            hand = Hand()
+            hand.add_closed_tiles(make_tiles_from_string("123m456p789s東東東"))
+            hand.closed_tiles.append(ALL_TILES_136[five_id])
+            win_tile = ALL_TILES_136[five_id + 2]
+            hand.draw(win_tile)
+            return calculate_score(
+                hand=hand, win_tile=win_tile, is_tsumo=True,
+                seat_wind_34=27, round_wind_34=27, is_dealer=True,
+                dora_tiles_34=[], uradora_tiles_34=[],
+            )
+
+        plain = score(17)  # 5m, win on another plain 5m
+        assert score(17).han == plain.han
+        assert score(16).han == plain.han + 1  # 赤5m
+
+    def test_repeat_scoring_returns_independent_results(self):
+        """Mutating one result must not leak into later calls."""
+        hand = Hand()
+        hand.add_closed_tiles(make_tiles_from_string("123m456p789s東東東南"))
+        win_tile = ALL_TILES_136[28 * 4 + 1]
+        hand.draw(win_tile)
+        kwargs = dict(
+            hand=hand, win_tile=win_tile, is_tsumo=True,
+            seat_wind_34=27, round_wind_34=27, is_dealer=True,
+            dora_tiles_34=[], uradora_tiles_34=[],
+        )
+        first = calculate_score(**kwargs)
+        expected = list(first.yaku)
+        first.yaku.append(("X", 99))
+        first.han = 99
+
+        second = calculate_score(**kwargs)
+        assert second is not first
+        assert second.yaku == expected
+        assert second.han != 99
@@ -3,22 +3,13 @@
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from mahjong.core.tile import counts_from_string
 from mahjong.rules.shanten import shanten, shanten_standard, shanten_chiitoi, shanten_kokushi
 
 
 def make_34(tiles_str):
     """Helper: create 34 array from shorthand."""
-    arr = [0] * 34
-    numbers = []
-    for ch in tiles_str:
-        if ch.isdigit():
-            numbers.append(int(ch))
-        elif ch in ('m', 'p', 's'):
-            offset = {'m': 0, 'p': 9, 's': 18}[ch]
-            for n in numbers:
-                arr[offset + n - 1] += 1
-            numbers = []
-    return arr
+    return counts_from_string(tiles_str)
 
 
 def add_honors(arr, east=0, south=0, west=0, north=0, haku=0, hatsu=0, chun=0):
@@ -102,3 +93,11 @@ class TestShanten:
         # All isolated tiles - very high shanten
         s = shanten_standard(arr)
         assert s >= 4
+
+    def test_partials_capped_across_suits(self):
+        """Taatsu spread over several suits count only up to the groups needed."""
+        # 6 taatsu + 11s head: only 4 groups can contribute
+        arr = make_34("1245m78m1245p78p11s")
+        before = list(arr)
+        assert shanten_standard(arr) == 3
+        assert arr == before
@@ -7,7 +7,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from mahjong.core.tile import (
     Tile, TileSuit, tiles_to_34_array, tile_id_to_34, tile_34_to_name,
     ALL_TILES_136, YAOCHU_INDICES, RED_FIVE_MAN, RED_FIVE_PIN, RED_FIVE_SOU,
-    next_tile_index, make_tiles_from_string,
+    next_tile_index, make_tiles_from_string, counts_from_string,
 )
 
 
@@ -125,3 +125,14 @@ class TestMakeTilesFromString:
         assert len(tiles) == 1
         assert tiles[0].is_red
         assert tiles[0].index34 == 4  # 5m position
+
+
+class TestCountsFromString:
+    def test_matches_tiles(self):
+        s = "1112345678999m0p東東"
+        assert counts_from_string(s) == tiles_to_34_array(make_tiles_from_string(s))
+
+    def test_fresh_list(self):
+        arr = counts_from_string("11m")
+        arr[0] = 0
+        assert counts_from_string("11m")[0] == 2
@@ -4,6 +4,7 @@ import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from mahjong.core.wall import Wall
+from mahjong.core.tile import next_tile_index
 
 
 class TestWall:
@@ -39,6 +40,16 @@ class TestWall:
         assert count == 122
         assert wall.draw() is None
 
+    def test_draw_follows_live_wall_order(self):
+        wall = Wall(is_sanma=False)
+        expected = wall.live_wall[:3]
+        assert [wall.draw() for _ in range(3)] == expected
+        # A kan's dora reveal removes the last live tile, not the next draw
+        last = wall.live_wall[-1]
+        wall.reveal_new_dora()
+        assert wall.remaining == 122 - 3 - 1
+        assert last not in wall.live_wall
+
     def test_dora_indicators(self):
         wall = Wall(is_sanma=False, shuffle=False)
         indicators = wall.dora_indicators
@@ -68,6 +79,14 @@ class TestWall:
         uradora_34 = wall.get_uradora_tiles_34()
         assert len(uradora_34) == 1
 
+    def test_dora_tiles_follow_reveal(self):
+        wall = Wall(is_sanma=False, shuffle=False)
+        assert len(wall.get_dora_tiles_34()) == 1
+        wall.reveal_new_dora()
+        dora_34 = wall.get_dora_tiles_34()
+        assert dora_34 == [next_tile_index(t.index34) for t in wall.dora_indicators]
+        assert len(wall.get_uradora_tiles_34()) == 2
+
     def test_max_dora_reveals(self):
         wall = Wall(is_sanma=False)
         for _ in range(5):
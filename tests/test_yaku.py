@@ -1,8 +1,11 @@
 """Tests for yaku.py - role detection"""
 
+import dataclasses
 import sys, os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import pytest
+
 from mahjong.rules.yaku import (
     HandContext, detect_all_yaku, total_han, has_yaku,
     check_tanyao, check_pinfu, check_toitoi, check_honitsu,
@@ -13,35 +16,33 @@ from mahjong.rules.yaku import (
     check_suuankou, check_ryuuiisou, check_chuuren,
 )
 from mahjong.core.meld import Meld, MeldType
-from mahjong.core.tile import ALL_TILES_136
+from mahjong.core.tile import ALL_TILES_136, counts_from_string
 
 
 def make_context(**kwargs) -> HandContext:
     """Helper to build HandContext with defaults."""
-    ctx = HandContext()
-    for k, v in kwargs.items():
-        setattr(ctx, k, v)
-    return ctx
+    return HandContext(**kwargs)
 
 
 def make_all_34(closed_str, honor_counts=None):
     """Build all_tiles_34 from string."""
-    arr = [0] * 34
-    numbers = []
-    for ch in closed_str:
-        if ch.isdigit():
-            numbers.append(int(ch))
-        elif ch in ('m', 'p', 's'):
-            offset = {'m': 0, 'p': 9, 's': 18}[ch]
-            for n in numbers:
-                arr[offset + n - 1] += 1
-            numbers = []
+    arr = counts_from_string(closed_str)
     if honor_counts:
         for idx, count in honor_counts.items():
             arr[idx] = count
     return arr
 
 
+class TestHandContext:
+    def test_frozen_and_hashable(self):
+        ctx = HandContext(head_34=5, mentsu=(('shuntsu', 0),))
+        # List-valued fields are stored as tuples
+        assert ctx == HandContext(head_34=5, mentsu=[('shuntsu', 0)])
+        assert hash(ctx) == hash(HandContext(head_34=5, mentsu=[('shuntsu', 0)]))
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            ctx.head_34 = 6
+
+
 class TestTanyao:
     def test_valid(self):
         arr = make_all_34("234m567p345s")